@@ -12,6 +12,7 @@ Main components:
 - NewsArticle: Class representing news articles related to trends
 - AdaptiveRateLimiter: Advanced rate limiting with emergency mode and circuit breaker
 - SessionManager: Session management with cookie persistence
+- get_session_manager: Cached factory sharing one SessionManager per arguments
 - TorProxyRotator: Free IP rotation using Tor network
 
 Enhanced features (Trust Insights fork):
@@ -31,7 +32,11 @@ from .client import Trends, BatchPeriod
 from .trend_keyword import TrendKeyword, TrendKeywordLite
 from .news_article import NewsArticle
 from .rate_limiter import AdaptiveRateLimiter, CircuitBreakerError
-from .session_manager import SessionManager
+from .session_manager import (
+    SessionManager,
+    get_session_manager,
+    reset_session_manager_cache,
+)
 from .tor_proxy import TorProxyRotator, create_tor_proxy
 
 __version__ = "0.2.0-enhanced"
@@ -45,6 +50,8 @@ __all__ = [
     "AdaptiveRateLimiter",
     "CircuitBreakerError",
     "SessionManager",
+    "get_session_manager",
+    "reset_session_manager_cache",
     "TorProxyRotator",
     "create_tor_proxy",
 ]
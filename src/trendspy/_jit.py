@@ -0,0 +1,36 @@
+# start src/trendspy/_jit.py
+"""
+Optional Numba JIT support
+
+Numba is an optional dependency; modules with hot numeric loops keep a
+pure-NumPy fallback and pick the implementation at import time.
+"""
+
+from typing import Callable
+
+try:
+    from numba import njit  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None  # type: ignore
+
+
+def jit_or_fallback(scan: Callable, fallback: Callable) -> Callable:
+    """
+    Compile a loop-based scan with Numba, or return the NumPy fallback.
+
+    Args:
+        scan: Plain-Python loop implementation (nopython-compatible)
+        fallback: Vectorized NumPy implementation with the same signature
+
+    Returns:
+        The cached njit-compiled scan when Numba is installed, else fallback
+    """
+    if NUMBA_AVAILABLE:
+        return njit(cache=True)(scan)
+    return fallback
+
+
+# end src/trendspy/_jit.py
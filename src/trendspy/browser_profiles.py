@@ -15,8 +15,17 @@ Each profile includes:
 - Realistic OS/architecture combinations
 """
 
+from __future__ import annotations
+
+import bisect
+import functools
+import itertools
 import random
-from typing import Dict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, FrozenSet, Mapping, overload
+
+if TYPE_CHECKING:
+    from typing import Literal  # Python 3.8+; annotations are not evaluated
 
 # Chrome 131 Profiles (November 2025 - CURRENT)
 CHROME_131_MACOS = {
@@ -107,6 +116,10 @@ BROWSER_PROFILES = {
     "edge131_windows": EDGE_131_WINDOWS,
 }
 
+# O(1) membership checks for profile names (e.g. `name in AVAILABLE_PROFILES`)
+AVAILABLE_PROFILES: FrozenSet[str] = frozenset(BROWSER_PROFILES)
+_AVAILABLE_PROFILES_STR = ", ".join(BROWSER_PROFILES)
+
 # Weighted selection (prefer current browsers)
 PROFILE_WEIGHTS = {
     "chrome131_macos": 25,  # Most common, current
@@ -119,30 +132,92 @@ PROFILE_WEIGHTS = {
     "edge131_windows": 5,  # Less common but realistic
 }
 
+# Precomputed selection tables (avoid rebuilding them on every request)
+_PROFILE_NAMES = tuple(PROFILE_WEIGHTS)
+_PROFILE_CUM_WEIGHTS = tuple(itertools.accumulate(PROFILE_WEIGHTS.values()))
+_PROFILE_TOTAL_WEIGHT = _PROFILE_CUM_WEIGHTS[-1]
+_CHROME_NAMES = (
+    "chrome131_macos",
+    "chrome131_windows",
+    "chrome130_macos",
+    "chrome130_windows",
+)
+
+# Read-only views for callers that only merge headers (no per-call dict copy)
+_FROZEN_PROFILES: Dict[str, Mapping[str, str]] = {
+    name: MappingProxyType(profile) for name, profile in BROWSER_PROFILES.items()
+}
+
+
+def _resolve_profile(name: str, copy: bool) -> Mapping[str, str]:
+    """Return a mutable copy or the shared read-only view of a profile."""
+    if copy:
+        return BROWSER_PROFILES[name].copy()
+    return _FROZEN_PROFILES[name]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_profile_frozen(name: str) -> Mapping[str, str]:
+    """Validate a profile name once and return its read-only view."""
+    if name not in AVAILABLE_PROFILES:
+        raise KeyError(
+            f"Profile '{name}' not found. Available profiles: "
+            f"{_AVAILABLE_PROFILES_STR}"
+        )
+    return _FROZEN_PROFILES[name]
+
 
-def get_random_profile() -> Dict[str, str]:
+@overload
+def get_random_profile(copy: Literal[True] = ...) -> Dict[str, str]: ...
+
+
+@overload
+def get_random_profile(copy: Literal[False]) -> Mapping[str, str]: ...
+
+
+@overload
+def get_random_profile(copy: bool) -> Mapping[str, str]: ...
+
+
+def get_random_profile(copy: bool = True) -> Mapping[str, str]:
     """
     Get a random browser profile with weighted selection.
 
     Weights favor current Chrome versions (131) over older ones,
     and Chrome over Firefox/Safari/Edge (matching real-world distribution).
 
+    Args:
+        copy: Return a fresh dict (default). Pass False to get a shared
+              read-only mapping when the headers are only read or merged.
+
     Returns:
         Dict with User-Agent and Client Hints headers
     """
-    profile_names = list(PROFILE_WEIGHTS.keys())
-    weights = list(PROFILE_WEIGHTS.values())
+    # Inverse-CDF draw over the cumulative weights
+    index = bisect.bisect(_PROFILE_CUM_WEIGHTS, random.random() * _PROFILE_TOTAL_WEIGHT)
+    selected_name = _PROFILE_NAMES[index]
+    return _resolve_profile(selected_name, copy)
+
+
+@overload
+def get_profile_by_name(name: str, copy: Literal[True] = ...) -> Dict[str, str]: ...
+
 
-    selected_name = random.choices(profile_names, weights=weights, k=1)[0]
-    return BROWSER_PROFILES[selected_name].copy()
+@overload
+def get_profile_by_name(name: str, copy: Literal[False]) -> Mapping[str, str]: ...
 
 
-def get_profile_by_name(name: str) -> Dict[str, str]:
+@overload
+def get_profile_by_name(name: str, copy: bool) -> Mapping[str, str]: ...
+
+
+def get_profile_by_name(name: str, copy: bool = True) -> Mapping[str, str]:
     """
     Get a specific browser profile by name.
 
     Args:
         name: Profile name (e.g., 'chrome131_macos', 'firefox132_windows')
+        copy: Return a fresh dict (default) or the shared read-only mapping
 
     Returns:
         Dict with User-Agent and Client Hints headers
@@ -150,49 +225,71 @@ def get_profile_by_name(name: str) -> Dict[str, str]:
     Raises:
         KeyError: If profile name doesn't exist
     """
-    if name not in BROWSER_PROFILES:
-        raise KeyError(
-            f"Profile '{name}' not found. Available profiles: "
-            f"{', '.join(BROWSER_PROFILES.keys())}"
-        )
-    return BROWSER_PROFILES[name].copy()
+    frozen = _get_profile_frozen(name)
+    return dict(frozen) if copy else frozen
+
+
+@overload
+def get_chrome_profiles_only(copy: Literal[True] = ...) -> Dict[str, str]: ...
+
+
+@overload
+def get_chrome_profiles_only(copy: Literal[False]) -> Mapping[str, str]: ...
+
+
+@overload
+def get_chrome_profiles_only(copy: bool) -> Mapping[str, str]: ...
 
 
-def get_chrome_profiles_only() -> Dict[str, str]:
+def get_chrome_profiles_only(copy: bool = True) -> Mapping[str, str]:
     """
     Get a random Chrome profile (any version, any OS).
 
     Useful when you specifically want Chrome behavior.
 
+    Args:
+        copy: Return a fresh dict (default) or the shared read-only mapping
+
     Returns:
         Dict with User-Agent and Client Hints headers
     """
-    chrome_names = [
-        "chrome131_macos",
-        "chrome131_windows",
-        "chrome130_macos",
-        "chrome130_windows",
-    ]
-    selected_name = random.choice(chrome_names)
-    return BROWSER_PROFILES[selected_name].copy()
+    selected_name = random.choice(_CHROME_NAMES)
+    return _resolve_profile(selected_name, copy)
 
 
 def list_available_profiles() -> list:
     """
     List all available browser profile names.
 
+    For membership tests prefer the AVAILABLE_PROFILES frozenset.
+
     Returns:
         List of profile name strings
     """
-    return list(BROWSER_PROFILES.keys())
+    return list(BROWSER_PROFILES)
 
 
 # For backward compatibility
-def get_coherent_headers() -> Dict[str, str]:
+@overload
+def get_coherent_headers(copy: Literal[True] = ...) -> Dict[str, str]: ...
+
+
+@overload
+def get_coherent_headers(copy: Literal[False]) -> Mapping[str, str]: ...
+
+
+@overload
+def get_coherent_headers(copy: bool) -> Mapping[str, str]: ...
+
+
+def get_coherent_headers(copy: bool = True) -> Mapping[str, str]:
     """
     Alias for get_random_profile() for backward compatibility.
 
+    Args:
+        copy: Return a fresh dict (default) or the shared read-only mapping
+
     Returns:
         Dict with User-Agent and Client Hints headers
     """
-    return get_random_profile()
+    return get_random_profile(copy=copy)
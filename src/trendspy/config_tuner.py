@@ -12,21 +12,113 @@ Features:
 - Automatic adjustment based on success rate
 """
 
+import atexit
 import json
 import logging
-from typing import Dict, Optional, List
+import os
+import weakref
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
-import statistics
+import numpy as np
+
+from ._jit import jit_or_fallback
+
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Defaults for config keys missing from a recorded session
+_CONFIG_DEFAULTS = {"base_delay": 15, "requests_per_hour": 150}
+
+# Initial capacity of the columnar metric arrays (doubled when full)
+_INITIAL_CAPACITY = 64
+
+
+def _find_best_numpy(
+    success_rate: np.ndarray, response_time: np.ndarray, min_rate: float
+) -> int:
+    """
+    Index of the best session: highest success rate, then fastest response.
+
+    Exact ties go to the earliest session, as with max() over the history.
+
+    Returns:
+        Index into the arrays, or -1 if no session reaches min_rate
+    """
+    acceptable = np.flatnonzero(success_rate >= min_rate)
+    if not acceptable.size:
+        return -1
+    rates = success_rate[acceptable]
+    top = acceptable[rates == rates.max()]
+    return int(top[np.argmin(response_time[top])])
+
+
+def _find_best_scan(
+    success_rate: np.ndarray, response_time: np.ndarray, min_rate: float
+) -> int:
+    """Single-pass loop version of _find_best_numpy (compiled with Numba)."""
+    best = -1
+    for i in range(success_rate.shape[0]):
+        rate = success_rate[i]
+        if rate < min_rate:
+            continue
+        if (
+            best < 0
+            or rate > success_rate[best]
+            or (rate == success_rate[best] and response_time[i] < response_time[best])
+        ):
+            best = i
+    return best
+
+
+_find_best = jit_or_fallback(_find_best_scan, _find_best_numpy)
+
+
+# Live tuners, flushed by one atexit hook (weak, so tuners can be collected)
+_LIVE_TUNERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_tuners():
+    """Write the buffered records of every tuner still alive at exit."""
+    for tuner in list(_LIVE_TUNERS):
+        tuner.flush()
+
+
+def _json_default(obj):
+    """Convert NumPy scalars (e.g. np.float64 metrics) to Python numbers."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj) -> bytes:
+    """Serialize history to compact JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ConfigTuner:
     """
     Automatically tunes configuration parameters based on performance.
 
     Tracks performance metrics for different configurations and suggests
-    optimal settings.
+    optimal settings. Success rates and response times are mirrored into
+    columnar NumPy arrays so aggregates run vectorized.
 
     Example:
         >>> tuner = ConfigTuner()
@@ -38,42 +130,126 @@ class ConfigTuner:
         >>> suggestion = tuner.auto_tune()
     """
 
-    def __init__(self, history_file: str = ".config_tuning_history.json"):
+    __slots__ = (
+        "history_file",
+        "_history",
+        "_success_rate",
+        "_response_time",
+        "_n",
+        "_dirty_count",
+        "_flush_every",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        history_file: str = ".config_tuning_history.json",
+        flush_every: int = 10,
+    ):
         """
         Initialize config tuner.
 
         Args:
             history_file: Path to save tuning history
+            flush_every: Number of recorded sessions buffered before writing
+                         history to disk (pending records are flushed at exit
+                         or by flush())
         """
         self.history_file = Path(history_file)
-        self.performance_history: List[Dict[str, float]] = []
+        self._history: List[Dict[str, float]] = []
+
+        # Columnar copies of the metrics used for aggregates
+        self._success_rate = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._response_time = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._n = 0
+
+        # Write buffering: only rewrite the file every N records
+        self._dirty_count = 0
+        self._flush_every = max(1, flush_every)
 
         # Load existing history if available
         self._load_history()
 
-        logger.info(f"ConfigTuner initialized (history_file={history_file})")
+        # Make sure buffered records are not lost on interpreter exit
+        _LIVE_TUNERS.add(self)
+
+        logger.info("ConfigTuner initialized (history_file=%s)", history_file)
+
+    @property
+    def performance_history(self) -> Tuple[Dict[str, float], ...]:
+        """
+        Recorded sessions, oldest first.
+
+        Returned as a tuple of copies: the columnar arrays mirror the
+        internal list, so sessions are only added through record_session().
+        """
+        return tuple(dict(record) for record in self._history)
 
     def _load_history(self):
         """Load performance history from file."""
         try:
-            if self.history_file.exists():
-                with open(self.history_file, "r") as f:
-                    self.performance_history = json.load(f)
-                logger.info(
-                    f"Loaded {len(self.performance_history)} historical sessions"
-                )
+            with open(self.history_file, "rb") as f:
+                data = f.read()
+            self._history = _loads(data) if data else []
+            self._rebuild_columns()
+            logger.info("Loaded %d historical sessions", len(self._history))
+        except FileNotFoundError:
+            self._history = []
+            self._rebuild_columns()
         except Exception as e:
             logger.warning(f"Could not load tuning history: {e}")
-            self.performance_history = []
+            self._history = []
+            self._rebuild_columns()
+
+    def _rebuild_columns(self):
+        """Rebuild the columnar metric arrays from the recorded history."""
+        n = len(self._history)
+        capacity = max(_INITIAL_CAPACITY, 1 << max(0, n - 1).bit_length())
+        self._success_rate = np.empty(capacity, dtype=np.float64)
+        self._response_time = np.empty(capacity, dtype=np.float64)
+        self._success_rate[:n] = [s["success_rate"] for s in self._history]
+        self._response_time[:n] = [s["response_time"] for s in self._history]
+        self._n = n
+
+    def _append_columns(self, success_rate: float, response_time: float):
+        """Append one session to the columnar arrays (amortized doubling)."""
+        if self._n == len(self._success_rate):
+            capacity = 2 * len(self._success_rate)
+            for name in ("_success_rate", "_response_time"):
+                grown = np.empty(capacity, dtype=np.float64)
+                grown[: self._n] = getattr(self, name)[: self._n]
+                setattr(self, name, grown)
+
+        self._success_rate[self._n] = success_rate
+        self._response_time[self._n] = response_time
+        self._n += 1
 
     def _save_history(self):
-        """Save performance history to file."""
+        """Save performance history to file (atomic temp-file rename)."""
+        try:
+            data = _dumps(self._history)
+        except Exception as e:
+            logger.error(f"Could not serialize tuning history: {e}")
+            return
+
+        tmp_file = self.history_file.with_suffix(self.history_file.suffix + ".tmp")
         try:
-            with open(self.history_file, "w") as f:
-                json.dump(self.performance_history, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+            os.replace(tmp_file, self.history_file)
+            self._dirty_count = 0
             logger.debug("Saved tuning history")
         except Exception as e:
             logger.error(f"Could not save tuning history: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def flush(self):
+        """Write any buffered session records to disk."""
+        if self._dirty_count:
+            self._save_history()
 
     def record_session(
         self,
@@ -91,21 +267,26 @@ class ConfigTuner:
             avg_response_time: Average response time in seconds
             requests_total: Total requests made
         """
+        # Defaults first so caller-supplied config keys override them
         session_record = {
-            "base_delay": config.get("base_delay", 15),
-            "requests_per_hour": config.get("requests_per_hour", 150),
+            **_CONFIG_DEFAULTS,
+            **config,
             "success_rate": success_rate,
             "response_time": avg_response_time,
             "requests_total": requests_total,
         }
 
-        self.performance_history.append(session_record)
-        self._save_history()
+        self._history.append(session_record)
+        self._append_columns(success_rate, avg_response_time)
+        self._dirty_count += 1
+        if self._dirty_count >= self._flush_every:
+            self._save_history()
 
         logger.info(
-            f"Recorded session: delay={session_record['base_delay']}s, "
-            f"success_rate={success_rate:.1f}%, "
-            f"response_time={avg_response_time:.2f}s"
+            "Recorded session: delay=%ss, success_rate=%.1f%%, response_time=%.2fs",
+            session_record["base_delay"],
+            success_rate,
+            avg_response_time,
         )
 
     def suggest_optimal_config(self, min_success_rate: float = 85.0) -> Optional[Dict]:
@@ -118,21 +299,22 @@ class ConfigTuner:
         Returns:
             Dict with suggested configuration, or None if insufficient data
         """
-        if len(self.performance_history) < 3:
+        if len(self._history) < 3:
             logger.info("Insufficient history for suggestions (need ≥3 sessions)")
             return None
 
-        # Filter to acceptable success rates
-        acceptable = [
-            s for s in self.performance_history if s["success_rate"] >= min_success_rate
-        ]
+        # Find best acceptable session by success rate, then by speed
+        best_index = _find_best(
+            self._success_rate[: self._n],
+            self._response_time[: self._n],
+            min_success_rate,
+        )
 
-        if not acceptable:
+        if best_index < 0:
             logger.warning("No sessions met minimum success rate threshold")
             return None
 
-        # Find best by success rate, then by speed
-        best = max(acceptable, key=lambda x: (x["success_rate"], -x["response_time"]))
+        best = self._history[int(best_index)]
 
         suggestion = {
             "base_delay": best["base_delay"],
@@ -142,8 +324,9 @@ class ConfigTuner:
         }
 
         logger.info(
-            f"Suggested config: delay={best['base_delay']}s "
-            f"(success_rate={best['success_rate']:.1f}%)"
+            "Suggested config: delay=%ss (success_rate=%.1f%%)",
+            best["base_delay"],
+            best["success_rate"],
         )
 
         return suggestion
@@ -155,16 +338,15 @@ class ConfigTuner:
         Returns:
             Dict with tuning adjustments, or None if no change needed
         """
-        if len(self.performance_history) < 5:
+        if len(self._history) < 5:
             logger.debug("Need more history for auto-tuning (≥5 sessions)")
             return None
 
         # Analyze recent performance (last 10 sessions)
-        recent = self.performance_history[-10:]
-        avg_success = statistics.mean([s["success_rate"] for s in recent])
+        avg_success = float(self._success_rate[max(0, self._n - 10) : self._n].mean())
 
         # Current config (assume latest)
-        current_delay = recent[-1]["base_delay"]
+        current_delay = self._history[-1]["base_delay"]
 
         adjustment = None
 
@@ -176,7 +358,7 @@ class ConfigTuner:
                 "reason": f"Low success rate ({avg_success:.1f}%) - increasing delays",
             }
             logger.info(
-                f"Auto-tune: {current_delay}s → {new_delay}s (low success rate)"
+                "Auto-tune: %ss → %ss (low success rate)", current_delay, new_delay
             )
 
         elif avg_success > 95 and current_delay > 5:
@@ -187,11 +369,11 @@ class ConfigTuner:
                 "reason": f"High success rate ({avg_success:.1f}%) - decreasing delays",
             }
             logger.info(
-                f"Auto-tune: {current_delay}s → {new_delay}s (high success rate)"
+                "Auto-tune: %ss → %ss (high success rate)", current_delay, new_delay
             )
 
         else:
-            logger.debug(f"No adjustment needed (success_rate={avg_success:.1f}%)")
+            logger.debug("No adjustment needed (success_rate=%.1f%%)", avg_success)
 
         return adjustment
 
@@ -202,28 +384,27 @@ class ConfigTuner:
         Returns:
             Dict with stats about tuning history
         """
-        if not self.performance_history:
+        if not self._history:
             return {
                 "total_sessions": 0,
                 "avg_success_rate": 0,
                 "best_success_rate": 0,
             }
 
-        success_rates = [s["success_rate"] for s in self.performance_history]
+        rates = self._success_rate[: self._n]
 
         return {
-            "total_sessions": len(self.performance_history),
-            "avg_success_rate": statistics.mean(success_rates),
-            "best_success_rate": max(success_rates),
-            "worst_success_rate": min(success_rates),
-            "recent_avg": statistics.mean(
-                [s["success_rate"] for s in self.performance_history[-10:]]
-            ),
+            "total_sessions": self._n,
+            "avg_success_rate": float(rates.mean()),
+            "best_success_rate": float(rates.max()),
+            "worst_success_rate": float(rates.min()),
+            "recent_avg": float(rates[-10:].mean()),
         }
 
     def reset(self):
         """Clear tuning history."""
-        self.performance_history = []
+        self._history = []
+        self._rebuild_columns()
         self._save_history()
         logger.info("ConfigTuner history cleared")
 
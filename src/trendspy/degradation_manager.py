@@ -13,6 +13,7 @@ Health States:
 
 import logging
 from enum import Enum
+from typing import Dict, FrozenSet, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,29 @@ class Priority(Enum):
     HIGH = "HIGH"
 
 
+# Priorities processed in each health state (one lookup per keyword decision)
+_PROCESS_TABLE: Dict[HealthState, FrozenSet[Priority]] = {
+    HealthState.HEALTHY: frozenset(Priority),
+    HealthState.RECOVERY: frozenset(Priority),  # Process all during recovery
+    HealthState.DEGRADED_MINOR: frozenset({Priority.HIGH, Priority.MEDIUM}),
+    HealthState.DEGRADED_MAJOR: frozenset({Priority.HIGH}),
+}
+
+# Precomputed state names and transition log messages (avoid Enum.value lookups)
+_STATE_NAMES: Dict[HealthState, str] = {state: state.value for state in HealthState}
+_DEGRADED_MSG: Dict[Tuple[HealthState, HealthState], str] = {
+    (old, new): f"Health degraded: {old.value} → {new.value} (consecutive_429s=%d)"
+    for old in HealthState
+    for new in HealthState
+}
+_IMPROVED_MSG: Dict[Tuple[HealthState, HealthState], str] = {
+    (old, new): f"Health improved: {old.value} → {new.value} "
+    "(consecutive_successes=%d)"
+    for old in HealthState
+    for new in HealthState
+}
+
+
 class DegradationManager:
     """
     Manages system health states and priority-based processing decisions.
@@ -50,6 +74,18 @@ class DegradationManager:
         >>>     # Process keyword
     """
 
+    __slots__ = (
+        "_minor_threshold",
+        "_major_threshold",
+        "_recovery_successes",
+        "_degrade_table",
+        "_full_recovery_successes",
+        "_health_state",
+        "_allowed_priorities",
+        "consecutive_429s",
+        "consecutive_successes",
+    )
+
     def __init__(
         self,
         minor_threshold: int = 5,
@@ -64,19 +100,71 @@ class DegradationManager:
             major_threshold: Consecutive 429s before major degradation
             recovery_successes: Consecutive successes to return to healthy
         """
-        self.minor_threshold = minor_threshold
-        self.major_threshold = major_threshold
-        self.recovery_successes = recovery_successes
+        self._minor_threshold = minor_threshold
+        self._major_threshold = major_threshold
+        self._recovery_successes = recovery_successes
+        self._rebuild_tables()
 
         self.health_state = HealthState.HEALTHY
         self.consecutive_429s = 0
         self.consecutive_successes = 0
 
-        logger.info(
-            f"DegradationManager initialized "
-            f"(minor_threshold={minor_threshold}, "
-            f"major_threshold={major_threshold})"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"DegradationManager initialized "
+                f"(minor_threshold={minor_threshold}, "
+                f"major_threshold={major_threshold})"
+            )
+
+    def _rebuild_tables(self):
+        """Recompute the transition tables derived from the thresholds."""
+        # Degradation thresholds, most severe first
+        self._degrade_table = (
+            (self._major_threshold, HealthState.DEGRADED_MAJOR),
+            (self._minor_threshold, HealthState.DEGRADED_MINOR),
         )
+        self._full_recovery_successes = self._recovery_successes * 2
+
+    @property
+    def minor_threshold(self) -> int:
+        """Consecutive 429s before minor degradation."""
+        return self._minor_threshold
+
+    @minor_threshold.setter
+    def minor_threshold(self, value: int):
+        self._minor_threshold = value
+        self._rebuild_tables()
+
+    @property
+    def major_threshold(self) -> int:
+        """Consecutive 429s before major degradation."""
+        return self._major_threshold
+
+    @major_threshold.setter
+    def major_threshold(self, value: int):
+        self._major_threshold = value
+        self._rebuild_tables()
+
+    @property
+    def recovery_successes(self) -> int:
+        """Consecutive successes before recovery (twice this: healthy)."""
+        return self._recovery_successes
+
+    @recovery_successes.setter
+    def recovery_successes(self, value: int):
+        self._recovery_successes = value
+        self._rebuild_tables()
+
+    @property
+    def health_state(self) -> HealthState:
+        """Current health state."""
+        return self._health_state
+
+    @health_state.setter
+    def health_state(self, state: HealthState):
+        # Specialize the priority check once per transition, not per keyword
+        self._health_state = state
+        self._allowed_priorities = _PROCESS_TABLE[state]
 
     def update_health(self, got_429: bool):
         """
@@ -89,17 +177,18 @@ class DegradationManager:
             self.consecutive_429s += 1
             self.consecutive_successes = 0
 
-            old_state = self.health_state
+            old_state = new_state = self._health_state
 
-            if self.consecutive_429s >= self.major_threshold:
-                self.health_state = HealthState.DEGRADED_MAJOR
-            elif self.consecutive_429s >= self.minor_threshold:
-                self.health_state = HealthState.DEGRADED_MINOR
+            for threshold, state in self._degrade_table:
+                if self.consecutive_429s >= threshold:
+                    new_state = state
+                    break
 
-            if self.health_state != old_state:
+            if new_state is not old_state:
+                self.health_state = new_state
                 logger.warning(
-                    f"Health degraded: {old_state.value} → {self.health_state.value} "
-                    f"(consecutive_429s={self.consecutive_429s})"
+                    _DEGRADED_MSG[(old_state, new_state)],
+                    self.consecutive_429s,
                 )
         else:
             self.consecutive_successes += 1
@@ -108,22 +197,23 @@ class DegradationManager:
             if self.consecutive_429s > 0:
                 self.consecutive_429s = max(0, self.consecutive_429s - 1)
 
-            old_state = self.health_state
+            old_state = new_state = self._health_state
 
-            # Return to healthy after enough successes
-            if self.consecutive_successes >= self.recovery_successes:
-                if self.health_state != HealthState.HEALTHY:
-                    self.health_state = HealthState.RECOVERY
+            # Full recovery after sustained success, else gradual recovery
+            if self.consecutive_successes >= self._full_recovery_successes:
+                new_state = HealthState.HEALTHY
+                self.consecutive_429s = 0
+            elif (
+                self.consecutive_successes >= self._recovery_successes
+                and old_state is not HealthState.HEALTHY
+            ):
+                new_state = HealthState.RECOVERY
 
-                # Full recovery after sustained success
-                if self.consecutive_successes >= self.recovery_successes * 2:
-                    self.health_state = HealthState.HEALTHY
-                    self.consecutive_429s = 0
-
-            if self.health_state != old_state:
+            if new_state is not old_state:
+                self.health_state = new_state
                 logger.info(
-                    f"Health improved: {old_state.value} → {self.health_state.value} "
-                    f"(consecutive_successes={self.consecutive_successes})"
+                    _IMPROVED_MSG[(old_state, new_state)],
+                    self.consecutive_successes,
                 )
 
     def should_process_keyword(self, keyword_priority: Priority) -> bool:
@@ -136,31 +226,15 @@ class DegradationManager:
         Returns:
             True if should process, False if should skip
         """
-        if self.health_state == HealthState.HEALTHY:
-            return True
-
-        elif self.health_state == HealthState.RECOVERY:
-            return True  # Process all during recovery
-
-        elif self.health_state == HealthState.DEGRADED_MINOR:
-            # Skip LOW priority only
-            should_process = keyword_priority in [Priority.HIGH, Priority.MEDIUM]
-            if not should_process:
-                logger.debug(
-                    f"Skipping {keyword_priority.value} priority (DEGRADED_MINOR)"
-                )
-            return should_process
-
-        elif self.health_state == HealthState.DEGRADED_MAJOR:
-            # Only HIGH priority
-            should_process = keyword_priority == Priority.HIGH
-            if not should_process:
-                logger.debug(
-                    f"Skipping {keyword_priority.value} priority (DEGRADED_MAJOR)"
-                )
-            return should_process
+        should_process = keyword_priority in self._allowed_priorities
 
-        return False
+        if not should_process and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Skipping %s priority (%s)",
+                keyword_priority.value,
+                self._health_state.name,
+            )
+        return should_process
 
     def get_health_status(self) -> dict:
         """
@@ -170,7 +244,7 @@ class DegradationManager:
             Dict with health state and metrics
         """
         return {
-            "health_state": self.health_state.value,
+            "health_state": _STATE_NAMES[self.health_state],
             "consecutive_429s": self.consecutive_429s,
             "consecutive_successes": self.consecutive_successes,
             "processing_all": self.health_state
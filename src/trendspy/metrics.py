@@ -10,20 +10,93 @@ Key metrics tracked:
 - Success rate
 - 429 errors
 - Response times (avg, min, max, p95)
+- Lifetime p95 response time (constant-memory HDR histogram, if hdrh installed)
 - Current delay settings
 - Consecutive failures
 
 Provides terminal dashboard for live monitoring during execution.
 """
 
+import sys
 import time
 import logging
-from typing import Dict, Optional, Deque
+from typing import Any, Dict, Optional, Deque
 from collections import deque
-import statistics
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:  # Python < 3.8
+    SHARED_MEMORY_AVAILABLE = False
+    shared_memory = None  # type: ignore
+
+try:
+    from hdrh.histogram import HdrHistogram  # type: ignore
+
+    HDRH_AVAILABLE = True
+except ImportError:
+    HDRH_AVAILABLE = False
+    HdrHistogram = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Lifetime response-time sketch range (microseconds: 1µs .. 60s, 3 sig. digits)
+_HIST_MAX_US = 60_000_000
+
+_DASHBOARD_TEMPLATE = "\n".join(
+    [
+        "",
+        "=" * 70,
+        "GOOGLE TRENDS API - PERFORMANCE DASHBOARD",
+        "=" * 70,
+        "Status: {status}               Emergency Mode: {emergency}",
+        "-" * 70,
+        "Success Rate:        {success_rate:6.2f}%",
+        "Total Requests:      {total_requests:6d}",
+        "  ├─ Successful:     {successful_requests:6d}",
+        "  ├─ Failed:         {failed_requests:6d}",
+        "  └─ 429 Errors:     {error_429_count:6d}",
+        "-" * 70,
+        "Response Times:",
+        "  ├─ Average:        {avg_response_time:6.2f}s",
+        "  └─ 95th %ile:      {p95_response_time:6.2f}s",
+        "-" * 70,
+        "Rate Limiting:",
+        "  ├─ Current Delay:  {current_delay:6.2f}s",
+        "  ├─ Consec Fails:   {consecutive_failures:6d}",
+        "  └─ Requests/Hour:  {requests_per_hour:6.1f}",
+        "-" * 70,
+        "Runtime:             {runtime_minutes:6.2f} minutes",
+        "=" * 70,
+        "",
+        "",
+    ]
+)
+
+# Slots of the request counters (an int64 array when shared across processes)
+_REQ_TOTAL = 0
+_REQ_OK = 1
+_REQ_429 = 2
+_REQ_FAIL = 3
+_N_COUNTERS = 8  # Room for future counters without changing segment size
+
+
+def _percentile(arr: np.ndarray, q: float) -> float:
+    """
+    Nearest-rank q-th percentile of a response-time snapshot (0 if empty).
+
+    Tiny windows are fully sorted; larger ones use quickselect.
+    """
+    n = arr.size
+    if not n:
+        return 0.0
+    k = min(int(n * (q / 100.0)), n - 1)
+    if n < 20:
+        return float(np.sort(arr)[k])
+    return float(np.partition(arr, k)[k])
+
 
 class MetricsCollector:
     """
@@ -36,32 +109,107 @@ class MetricsCollector:
         >>> metrics = MetricsCollector()
         >>> metrics.record_request(success=True, response_time=1.5, status_code=200)
         >>> metrics.print_dashboard()
+
+    Request counters can be aggregated across worker processes by giving
+    every worker the same shared_name (and a multiprocessing.Lock):
+
+        >>> lock = multiprocessing.Lock()
+        >>> metrics = MetricsCollector(shared_name="trendspy_metrics", lock=lock)
     """
 
-    def __init__(self, window_size: int = 100):
+    __slots__ = (
+        "window_size",
+        "_counters",
+        "_shm",
+        "_shm_owner",
+        "_lock",
+        "response_times",
+        "_status_class",
+        "current_delay",
+        "consecutive_failures",
+        "emergency_mode",
+        "start_time",
+        "last_request_time",
+        "last_success_time",
+        "last_failure_time",
+        "hourly_requests",
+        "hourly_timestamps",
+        "_last10",
+        "_rph_sum10",
+        "_current_minute",
+        "_rt_sum",
+        "_rt_hist",
+        "_rt_cache",
+        "_rt_cache_key",
+        "_summary_cache",
+        "_summary_key",
+    )
+
+    def __init__(
+        self,
+        window_size: int = 100,
+        shared_name: Optional[str] = None,
+        lock: Optional[Any] = None,
+    ):
         """
         Initialize metrics collector.
 
         Args:
             window_size: Number of recent requests to track for rolling stats
+            shared_name: Name of a shared memory segment holding the request
+                counters; attached if it exists, created otherwise. None keeps
+                counters local to this process.
+            lock: Lock guarding shared counter updates; required with
+                shared_name, and must be the same multiprocessing.Lock in
+                every worker (a per-process lock excludes nothing).
+
+        Raises:
+            ValueError: If shared_name is given without a lock
         """
+        if shared_name is not None and lock is None:
+            raise ValueError("shared_name requires a lock shared by all workers")
+
         self.window_size = window_size
+        self._lock = lock
+
+        # Request counters: plain ints unless shared, then an int64 array in
+        # shared memory (the only case that pays for NumPy element updates)
+        self._shm = None
+        self._shm_owner = False
+        if shared_name is not None and SHARED_MEMORY_AVAILABLE:
+            try:
+                self._shm = shared_memory.SharedMemory(
+                    name=shared_name, create=True, size=_N_COUNTERS * 8
+                )
+                self._shm_owner = True
+            except FileExistsError:
+                self._shm = shared_memory.SharedMemory(name=shared_name)
+            self._counters = np.ndarray(
+                (_N_COUNTERS,), dtype=np.int64, buffer=self._shm.buf
+            )
+        else:
+            if shared_name is not None:
+                logger.warning(
+                    "Shared memory unavailable - metrics counters are process-local"
+                )
+            self._counters = [0] * _N_COUNTERS
+
+        self._init_state()
+
+        logger.info("MetricsCollector initialized")
+
+    def _init_state(self) -> None:
+        """Initialize the process-local metrics (everything except counters)."""
+        window_size = self.window_size
 
         # Core metrics
-        response_times: Deque[float] = deque(maxlen=window_size)
-        status_codes: Deque[int] = deque(maxlen=window_size)
-
-        self.metrics: Dict = {
-            "requests_total": 0,
-            "requests_success": 0,
-            "requests_429": 0,
-            "requests_failed": 0,
-            "response_times": response_times,
-            "status_codes": status_codes,
-            "current_delay": 15.0,
-            "consecutive_failures": 0,
-            "emergency_mode": False,
-        }
+        self.response_times: Deque[float] = deque(maxlen=window_size)
+        # Counts by status // 100; slot 0 counts missing/out-of-range codes
+        self._status_class = [0] * 6
+        self._rt_sum: float = 0.0  # Running sum of response_times
+        self.current_delay: float = 15.0
+        self.consecutive_failures: int = 0
+        self.emergency_mode: bool = False
 
         # Timestamps
         self.start_time: float = time.time()
@@ -73,13 +221,27 @@ class MetricsCollector:
         self.hourly_requests: Deque[int] = deque(maxlen=60)  # Track requests per minute
         self.hourly_timestamps: Deque[float] = deque(maxlen=60)
 
-        logger.info("MetricsCollector initialized")
+        # Running total over the last 10 minute buckets (O(1) requests/hour)
+        self._last10: Deque[int] = deque(maxlen=10)
+        self._rph_sum10: int = 0
+        self._current_minute: Optional[int] = None
+
+        # Lifetime response-time sketch (O(1) record, fixed memory)
+        self._rt_hist = HdrHistogram(1, _HIST_MAX_US, 3) if HDRH_AVAILABLE else None
+
+        # NumPy snapshot of response_times, rebuilt when requests_total changes
+        self._rt_cache: np.ndarray = np.empty(0, dtype=np.float64)
+        self._rt_cache_key: int = 0
+
+        # get_summary() values derived from recorded requests
+        self._summary_cache: Optional[Dict] = None
+        self._summary_key: Optional[tuple] = None
 
     def record_request(
         self,
         success: bool,
         response_time: float,
-        status_code: int,
+        status_code: Optional[int],
         current_delay: Optional[float] = None,
         consecutive_failures: int = 0,
         emergency_mode: bool = False,
@@ -90,41 +252,104 @@ class MetricsCollector:
         Args:
             success: Whether request succeeded (200 OK)
             response_time: Time taken for request in seconds
-            status_code: HTTP status code
+            status_code: HTTP status code (None if no response was received)
             current_delay: Current delay setting (optional)
             consecutive_failures: Number of consecutive failures
             emergency_mode: Whether in emergency mode
         """
-        self.metrics["requests_total"] += 1
+        now = time.time()
+        counters = self._counters
+        if self._shm is None:
+            counters[_REQ_TOTAL] += 1
+            counters[_REQ_OK if success else _REQ_FAIL] += 1
+            if status_code == 429:
+                counters[_REQ_429] += 1
+        else:
+            with self._lock:
+                counters[_REQ_TOTAL] += 1
+                counters[_REQ_OK if success else _REQ_FAIL] += 1
+                if status_code == 429:
+                    counters[_REQ_429] += 1
 
         if success:
-            self.metrics["requests_success"] += 1
-            self.last_success_time = time.time()
+            self.last_success_time = now
         else:
-            self.metrics["requests_failed"] += 1
-            self.last_failure_time = time.time()
-
-        if status_code == 429:
-            self.metrics["requests_429"] += 1
-
-        self.metrics["response_times"].append(response_time)
-        self.metrics["status_codes"].append(status_code)
+            self.last_failure_time = now
+
+        response_times = self.response_times
+        if len(response_times) == self.window_size:
+            self._rt_sum -= response_times[0]
+        response_times.append(response_time)
+        self._rt_sum += response_time
+        if self._rt_hist is not None:
+            self._rt_hist.record_value(
+                min(max(int(response_time * 1e6), 1), _HIST_MAX_US)
+            )
+        if status_code is not None and 100 <= status_code < 600:
+            self._status_class[status_code // 100] += 1
+        else:
+            self._status_class[0] += 1
 
         if current_delay is not None:
-            self.metrics["current_delay"] = current_delay
+            self.current_delay = current_delay
 
-        self.metrics["consecutive_failures"] = consecutive_failures
-        self.metrics["emergency_mode"] = emergency_mode
+        self.consecutive_failures = consecutive_failures
+        self.emergency_mode = emergency_mode
 
-        self.last_request_time = time.time()
+        self.last_request_time = now
 
         # Track for hourly rate
-        current_minute = int(time.time() / 60)
-        if not self.hourly_timestamps or self.hourly_timestamps[-1] != current_minute:
+        current_minute = int(now / 60)
+        if current_minute != self._current_minute:
+            self._current_minute = current_minute
             self.hourly_timestamps.append(current_minute)
             self.hourly_requests.append(1)
+            if len(self._last10) == 10:
+                self._rph_sum10 -= self._last10[0]
+            self._last10.append(1)
         else:
             self.hourly_requests[-1] += 1
+            self._last10[-1] += 1
+        self._rph_sum10 += 1
+
+    @property
+    def requests_total(self) -> int:
+        """Total requests recorded (across workers if shared)."""
+        return int(self._counters[_REQ_TOTAL])
+
+    @property
+    def requests_success(self) -> int:
+        """Successful requests recorded (across workers if shared)."""
+        return int(self._counters[_REQ_OK])
+
+    @property
+    def requests_429(self) -> int:
+        """429 responses recorded (across workers if shared)."""
+        return int(self._counters[_REQ_429])
+
+    @property
+    def requests_failed(self) -> int:
+        """Failed requests recorded (across workers if shared)."""
+        return int(self._counters[_REQ_FAIL])
+
+    @property
+    def metrics(self) -> Dict:
+        """
+        Snapshot of the core metrics as a dict (for backward compatibility).
+
+        Returns:
+            Dict of counters, rolling deques and current settings
+        """
+        return {
+            "requests_total": self.requests_total,
+            "requests_success": self.requests_success,
+            "requests_429": self.requests_429,
+            "requests_failed": self.requests_failed,
+            "response_times": self.response_times,
+            "current_delay": self.current_delay,
+            "consecutive_failures": self.consecutive_failures,
+            "emergency_mode": self.emergency_mode,
+        }
 
     def get_success_rate(self) -> float:
         """
@@ -133,10 +358,28 @@ class MetricsCollector:
         Returns:
             Success rate (0-100)
         """
-        if self.metrics["requests_total"] == 0:
+        if self.requests_total == 0:
             return 0.0
 
-        return (self.metrics["requests_success"] / self.metrics["requests_total"]) * 100
+        return (self.requests_success / self.requests_total) * 100
+
+    def _response_time_array(self) -> np.ndarray:
+        """
+        Get the rolling response times as a NumPy array.
+
+        The snapshot is cached until the next recorded request, so repeated
+        dashboard/summary reads share a single conversion.
+
+        Returns:
+            float64 array of recent response times
+        """
+        if self._rt_cache_key != self.requests_total:
+            response_times = self.response_times
+            self._rt_cache = np.fromiter(
+                response_times, dtype=np.float64, count=len(response_times)
+            )
+            self._rt_cache_key = self.requests_total
+        return self._rt_cache
 
     def get_avg_response_time(self) -> float:
         """
@@ -145,10 +388,8 @@ class MetricsCollector:
         Returns:
             Average response time in seconds, or 0 if no data
         """
-        if not self.metrics["response_times"]:
-            return 0.0
-
-        return statistics.mean(self.metrics["response_times"])
+        n = len(self.response_times)
+        return self._rt_sum / n if n else 0.0
 
     def get_p95_response_time(self) -> float:
         """
@@ -157,12 +398,22 @@ class MetricsCollector:
         Returns:
             P95 response time in seconds, or 0 if no data
         """
-        if not self.metrics["response_times"]:
-            return 0.0
+        return _percentile(self._response_time_array(), 95)
 
-        sorted_times = sorted(self.metrics["response_times"])
-        index = int(len(sorted_times) * 0.95)
-        return sorted_times[index] if index < len(sorted_times) else sorted_times[-1]
+    def get_lifetime_p95_response_time(self) -> Optional[float]:
+        """
+        95th percentile response time over the whole run (not just the window).
+
+        Answered in O(1) from an HDR histogram sketch updated on every request.
+
+        Returns:
+            P95 response time in seconds, or None if hdrh is not installed
+            or no requests were recorded
+        """
+        if self._rt_hist is None or not self._rt_hist.get_total_count():
+            return None
+
+        return self._rt_hist.get_value_at_percentile(95) / 1e6
 
     def get_requests_per_hour(self) -> float:
         """
@@ -174,14 +425,8 @@ class MetricsCollector:
         if len(self.hourly_requests) < 2:
             return 0.0
 
-        # Sum requests from last N minutes and extrapolate
-        recent_requests = sum(list(self.hourly_requests)[-10:])  # Last 10 minutes
-        minutes_tracked = min(10, len(self.hourly_requests))
-
-        if minutes_tracked == 0:
-            return 0.0
-
-        requests_per_minute = recent_requests / minutes_tracked
+        # Running sum of the last 10 minutes, extrapolated to an hour
+        requests_per_minute = self._rph_sum10 / len(self._last10)
         return requests_per_minute * 60
 
     def get_runtime(self) -> float:
@@ -207,11 +452,8 @@ class MetricsCollector:
         - Requests per hour
         - Runtime
         """
-        runtime = self.get_runtime()
-        success_rate = self.get_success_rate()
-        avg_response = self.get_avg_response_time()
-        p95_response = self.get_p95_response_time()
-        req_per_hour = self.get_requests_per_hour()
+        summary = self.get_summary()
+        success_rate = summary["success_rate"]
 
         # Status indicator
         if success_rate >= 95:
@@ -224,57 +466,82 @@ class MetricsCollector:
             status = "🔴 CRITICAL"
 
         # Emergency mode indicator
-        emergency = "🚨 EMERGENCY" if self.metrics["emergency_mode"] else "✓ Normal"
-
-        print(f"\n{'='*70}")
-        print("GOOGLE TRENDS API - PERFORMANCE DASHBOARD")
-        print(f"{'='*70}")
-        print(f"Status: {status}               Emergency Mode: {emergency}")
-        print(f"{'-'*70}")
-        print(f"Success Rate:        {success_rate:6.2f}%")
-        print(f"Total Requests:      {self.metrics['requests_total']:6d}")
-        print(f"  ├─ Successful:     {self.metrics['requests_success']:6d}")
-        print(f"  ├─ Failed:         {self.metrics['requests_failed']:6d}")
-        print(f"  └─ 429 Errors:     {self.metrics['requests_429']:6d}")
-        print(f"{'-'*70}")
-        print("Response Times:")
-        print(f"  ├─ Average:        {avg_response:6.2f}s")
-        print(f"  └─ 95th %ile:      {p95_response:6.2f}s")
-        print(f"{'-'*70}")
-        print("Rate Limiting:")
-        print(f"  ├─ Current Delay:  {self.metrics['current_delay']:6.2f}s")
-        print(f"  ├─ Consec Fails:   {self.metrics['consecutive_failures']:6d}")
-        print(f"  └─ Requests/Hour:  {req_per_hour:6.1f}")
-        print(f"{'-'*70}")
-        print(f"Runtime:             {runtime/60:6.2f} minutes")
-        print(f"{'='*70}\n")
+        emergency = "🚨 EMERGENCY" if summary["emergency_mode"] else "✓ Normal"
+
+        # Single write keeps the dashboard intact when interleaved with logging
+        sys.stdout.write(
+            _DASHBOARD_TEMPLATE.format(
+                status=status,
+                emergency=emergency,
+                runtime_minutes=summary["runtime_seconds"] / 60,
+                **summary,
+            )
+        )
+        sys.stdout.flush()
 
     def get_summary(self) -> Dict:
         """
         Get metrics summary as dictionary.
 
+        Request-derived values are cached until the next recorded request;
+        only the runtime is recomputed on every call.
+
         Returns:
             Dict with all key metrics
         """
+        key = (self.requests_total, len(self.response_times))
+        if key != self._summary_key:
+            self._summary_cache = self._compute_summary()
+            self._summary_key = key
+
+        return {**self._summary_cache, "runtime_seconds": self.get_runtime()}
+
+    def _compute_summary(self) -> Dict:
+        """Compute the request-derived part of get_summary()."""
+        status_class = self._status_class
         return {
             "success_rate": self.get_success_rate(),
-            "total_requests": self.metrics["requests_total"],
-            "successful_requests": self.metrics["requests_success"],
-            "failed_requests": self.metrics["requests_failed"],
-            "error_429_count": self.metrics["requests_429"],
+            "total_requests": self.requests_total,
+            "successful_requests": self.requests_success,
+            "failed_requests": self.requests_failed,
+            "error_429_count": self.requests_429,
             "avg_response_time": self.get_avg_response_time(),
             "p95_response_time": self.get_p95_response_time(),
-            "current_delay": self.metrics["current_delay"],
-            "consecutive_failures": self.metrics["consecutive_failures"],
-            "emergency_mode": self.metrics["emergency_mode"],
+            "lifetime_p95_response_time": self.get_lifetime_p95_response_time(),
+            "current_delay": self.current_delay,
+            "consecutive_failures": self.consecutive_failures,
+            "emergency_mode": self.emergency_mode,
             "requests_per_hour": self.get_requests_per_hour(),
-            "runtime_seconds": self.get_runtime(),
+            "status_1xx": status_class[1],
+            "status_2xx": status_class[2],
+            "status_3xx": status_class[3],
+            "status_4xx": status_class[4],
+            "status_5xx": status_class[5],
+            "status_other": status_class[0],
         }
 
     def reset(self):
         """Reset all metrics (useful for testing or new runs)."""
-        self.__init__(window_size=self.window_size)
+        if self._shm is None:
+            self._counters = [0] * _N_COUNTERS
+        else:
+            with self._lock:
+                self._counters[:] = 0
+        self._init_state()
         logger.info("Metrics reset")
 
+    def close(self):
+        """Detach from the shared counter segment (unlinking it if we created it)."""
+        if self._shm is None:
+            return
+
+        # Keep the last values readable after the segment goes away
+        self._counters = self._counters.tolist()
+        self._shm.close()
+        if self._shm_owner:
+            self._shm.unlink()
+        self._shm = None
+        self._shm_owner = False
+
 
 # end src/trendspy/metrics.py
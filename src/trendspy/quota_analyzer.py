@@ -13,12 +13,132 @@ This helps optimize wait times by:
 
 import time
 import logging
-from typing import Optional, Dict, Deque
-from collections import deque
+from typing import Optional, Dict, Tuple
 import numpy as np
 
+from ._jit import jit_or_fallback
+
 logger = logging.getLogger(__name__)
 
+# Gaps longer than this (seconds) are breaks, not quota windows
+_MAX_DELTA = 3600.0
+_HIST_BINS = 20
+# float32 offsets beyond this (~12 days) would be coarser than 1/8 s
+_F32_OFFSET_LIMIT = 2.0**20
+
+
+def _modal_delta_numpy(
+    sorted_ts: np.ndarray, max_delta: float, nbins: int
+) -> Tuple[float, int]:
+    """
+    Modal interval between consecutive timestamps using fixed-width bincount.
+
+    Returns:
+        (center of the most populated bin, number of valid deltas)
+    """
+    deltas = np.diff(sorted_ts)
+    deltas = deltas[deltas < max_delta]
+    if len(deltas) < 5:
+        return 0.0, len(deltas)
+
+    lo, hi = deltas.min(), deltas.max()
+    if hi == lo:
+        return float(lo), len(deltas)
+
+    scale = nbins / (hi - lo)
+    idx = np.minimum(((deltas - lo) * scale).astype(np.int64), nbins - 1)
+    modal_index = np.argmax(np.bincount(idx, minlength=nbins))
+    return float(lo + (modal_index + 0.5) / scale), len(deltas)
+
+
+def _modal_delta_scan(
+    sorted_ts: np.ndarray, max_delta: float, nbins: int
+) -> Tuple[float, int]:
+    """Loop version of _modal_delta_numpy without temporaries (Numba-compiled)."""
+    n_valid = 0
+    lo = np.inf
+    hi = -np.inf
+    for i in range(sorted_ts.shape[0] - 1):
+        d = sorted_ts[i + 1] - sorted_ts[i]
+        if d < max_delta:
+            n_valid += 1
+            lo = min(lo, d)
+            hi = max(hi, d)
+
+    if n_valid < 5:
+        return 0.0, n_valid
+    if hi == lo:
+        return lo, n_valid
+
+    counts = np.zeros(nbins, np.int64)
+    scale = nbins / (hi - lo)
+    for i in range(sorted_ts.shape[0] - 1):
+        d = sorted_ts[i + 1] - sorted_ts[i]
+        if d < max_delta:
+            counts[min(int((d - lo) * scale), nbins - 1)] += 1
+
+    modal_index = np.argmax(counts)
+    return lo + (modal_index + 0.5) / scale, n_valid
+
+
+_modal_delta = jit_or_fallback(_modal_delta_scan, _modal_delta_numpy)
+
+
+class _TimestampRing:
+    """
+    Fixed-size ring buffer of timestamps stored as offsets from an epoch.
+
+    The epoch is the first timestamp recorded, so offsets stay small whatever
+    clock the caller uses. Offsets are float32 (a quarter of the memory of a
+    deque of Python floats, at 1/8 s precision or better) until one reaches
+    _F32_OFFSET_LIMIT, after which the buffer switches to float64.
+    """
+
+    __slots__ = ("epoch", "_buf", "_head", "_count")
+
+    def __init__(self, size: int):
+        self.epoch = 0.0
+        self._buf = np.empty(size, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float) -> None:
+        """Store a Unix timestamp, overwriting the oldest when full."""
+        size = self._buf.shape[0]
+        if not size:
+            return
+        if not self._count:
+            self.epoch = timestamp
+        offset = timestamp - self.epoch
+        if abs(offset) >= _F32_OFFSET_LIMIT and self._buf.dtype == np.float32:
+            self._buf = self._buf.astype(np.float64)
+        self._buf[(self._head + self._count) % size] = offset
+        if self._count < size:
+            self._count += 1
+        else:
+            self._head = (self._head + 1) % size
+
+    def offsets(self) -> np.ndarray:
+        """Stored offsets oldest-first; a view unless the buffer has wrapped."""
+        end = self._head + self._count
+        if end <= self._buf.shape[0]:
+            return self._buf[self._head : end]
+        return np.concatenate(
+            (self._buf[self._head :], self._buf[: end - self._buf.shape[0]])
+        )
+
+    def timestamps(self) -> np.ndarray:
+        """Stored Unix timestamps oldest-first, as a new float64 array."""
+        return self.offsets().astype(np.float64) + self.epoch
+
+    def clear(self) -> None:
+        self._buf = np.empty(self._buf.shape[0], dtype=np.float32)
+        self._head = 0
+        self._count = 0
+
 
 class QuotaAnalyzer:
     """
@@ -41,12 +161,29 @@ class QuotaAnalyzer:
             history_size: Number of historical results to track
         """
         self.history_size = history_size
-        self.success_timestamps: Deque[float] = deque(maxlen=history_size)
-        self.failure_timestamps: Deque[float] = deque(maxlen=history_size)
+
+        # Compact offset buffers (see success_timestamps property)
+        self._successes = _TimestampRing(history_size)
+        self._failures = _TimestampRing(history_size)
         self.detected_window: Optional[float] = None  # Detected quota window in seconds
 
+        # Timestamps normally arrive in order; track it so sorting can be skipped
+        self._successes_ordered = True
+        self._last_success: Optional[float] = None
+        self._last_failure: Optional[float] = None
+
         logger.info(f"QuotaAnalyzer initialized (history_size={history_size})")
 
+    @property
+    def success_timestamps(self) -> np.ndarray:
+        """Recorded success timestamps (Unix seconds, oldest-first)."""
+        return self._successes.timestamps()
+
+    @property
+    def failure_timestamps(self) -> np.ndarray:
+        """Recorded failure timestamps (Unix seconds, oldest-first)."""
+        return self._failures.timestamps()
+
     def record_result(self, success: bool, timestamp: Optional[float] = None):
         """
         Record a request result with timestamp.
@@ -59,9 +196,14 @@ class QuotaAnalyzer:
             timestamp = time.time()
 
         if success:
-            self.success_timestamps.append(timestamp)
+            if self._last_success is not None and timestamp < self._last_success:
+                self._successes_ordered = False
+            self._last_success = timestamp
+            self._successes.append(timestamp)
         else:
-            self.failure_timestamps.append(timestamp)
+            self._failures.append(timestamp)
+            if self._last_failure is None or timestamp > self._last_failure:
+                self._last_failure = timestamp
 
     def detect_quota_window(self) -> Optional[float]:
         """
@@ -73,30 +215,26 @@ class QuotaAnalyzer:
         Returns:
             Detected quota window in seconds, or None if insufficient data
         """
-        if len(self.success_timestamps) < 10:
+        if len(self._successes) < 10:
             logger.debug("Insufficient data for quota window detection")
             return None
 
-        # Calculate time deltas between consecutive successes
-        timestamps = sorted(self.success_timestamps)
-        deltas = np.diff(timestamps)
-
-        # Filter outliers (>1 hour likely indicates breaks, not quota)
-        deltas = deltas[deltas < 3600]
+        # Time deltas between consecutive successes; outliers (>1 hour) are
+        # breaks rather than quota windows. Modal interval found via histogram.
+        timestamps = self._successes.offsets().astype(np.float64)
+        if not self._successes_ordered:
+            timestamps.sort()
 
-        if len(deltas) < 5:
-            logger.debug("Insufficient valid deltas for detection")
-            return None
-
-        # Find modal interval using histogram
         try:
-            hist, bins = np.histogram(deltas, bins=20)
-            modal_index = np.argmax(hist)
-            modal_window = (bins[modal_index] + bins[modal_index + 1]) / 2
+            modal_window, n_valid = _modal_delta(timestamps, _MAX_DELTA, _HIST_BINS)
+
+            if n_valid < 5:
+                logger.debug("Insufficient valid deltas for detection")
+                return None
 
             self.detected_window = modal_window
             logger.info(
-                f"Detected quota window: {modal_window:.1f}s ({modal_window/60:.1f}m)"
+                "Detected quota window: %.1fs (%.1fm)", modal_window, modal_window / 60
             )
             return modal_window
 
@@ -111,7 +249,7 @@ class QuotaAnalyzer:
         Returns:
             Predicted Unix timestamp of next reset, or None if cannot predict
         """
-        if not self.failure_timestamps:
+        if not self._failures:
             logger.debug("No failures recorded, cannot predict reset")
             return None
 
@@ -123,14 +261,16 @@ class QuotaAnalyzer:
         else:
             window = self.detected_window
 
-        # Use last failure time as reference
-        last_failure = max(self.failure_timestamps)
+        # Use last failure time as reference (full float64 precision)
+        last_failure = self._last_failure
         predicted_reset = last_failure + window
 
-        logger.debug(
-            f"Predicted reset in {predicted_reset - time.time():.0f}s "
-            f"(at {time.strftime('%H:%M:%S', time.localtime(predicted_reset))})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Predicted reset in %.0fs (at %s)",
+                predicted_reset - time.time(),
+                time.strftime("%H:%M:%S", time.localtime(predicted_reset)),
+            )
 
         return predicted_reset
 
@@ -169,8 +309,8 @@ class QuotaAnalyzer:
             Dict with stats about detected patterns
         """
         return {
-            "total_successes": len(self.success_timestamps),
-            "total_failures": len(self.failure_timestamps),
+            "total_successes": len(self._successes),
+            "total_failures": len(self._failures),
             "detected_window_seconds": self.detected_window,
             "detected_window_minutes": self.detected_window / 60
             if self.detected_window is not None
@@ -180,9 +320,12 @@ class QuotaAnalyzer:
 
     def reset(self):
         """Clear all historical data."""
-        self.success_timestamps.clear()
-        self.failure_timestamps.clear()
+        self._successes.clear()
+        self._failures.clear()
         self.detected_window = None
+        self._successes_ordered = True
+        self._last_success = None
+        self._last_failure = None
         logger.info("QuotaAnalyzer reset")
 
 
@@ -19,13 +19,15 @@ License: MIT (see LICENSE file)
 
 import time
 import logging
-import random
-from collections import deque
-from datetime import datetime, timedelta
-from typing import Deque
+from typing import Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Number of precomputed jitter multipliers (power of two, refilled on wrap)
+_JITTER_TABLE_SIZE = 1024
+
 
 class AdaptiveRateLimiter:
     """
@@ -66,17 +68,28 @@ class AdaptiveRateLimiter:
         self.emergency_threshold = emergency_threshold
         self.emergency_multiplier = emergency_multiplier
 
-        # Sliding window of request timestamps
-        self.request_times: Deque[datetime] = deque(maxlen=requests_per_hour)
+        # Sliding window of request timestamps (time.monotonic() seconds),
+        # kept in a fixed ring buffer: oldest at _head, _count entries
+        self._rt_buf = np.empty(requests_per_hour, dtype=np.float64)
+        self._head = 0
+        self._count = 0
 
         # Circuit breaker state
         self.consecutive_failures = 0
-        self.emergency_mode = False
+        self._emergency_mode = False
         self.last_request_time: float = 0
 
+        # Delay factor for the current mode (emergency_multiplier or 1.0),
+        # updated on mode changes so wait_if_needed needs no mode branches
+        self._emergency_factor = 1.0
+
         # Phase 1.3: Adaptive delay escalation
         self.delay_multiplier = 1.0
 
+        # Phase 1.2: Precomputed jitter tables (amortize RNG calls)
+        self._rng = np.random.default_rng()
+        self._refill_jitter()
+
         logger.info(
             f"Initialized AdaptiveRateLimiter: "
             f"{requests_per_hour} req/hr, "
@@ -95,69 +108,158 @@ class AdaptiveRateLimiter:
         Phase 1.2: Applies timing jitter in BOTH normal and emergency modes
         to prevent predictable robot patterns.
         """
-        current_time = time.time()
-
-        # Enforce minimum delay since last request
-        if self.last_request_time > 0:
-            time_since_last = current_time - self.last_request_time
-
-            # Phase 1.3: Calculate effective delay with adaptive multiplier
-            effective_delay = self.base_delay * self.delay_multiplier
-            if self.emergency_mode:
-                effective_delay *= self.emergency_multiplier
-
-            # Phase 1.2: ALWAYS add jitter (not just emergency mode)
-            # Normal mode: ±15% jitter, Emergency mode: ±25% jitter
-            if self.emergency_mode:
-                jitter = random.uniform(0.75, 1.25)  # ±25%
-            else:
-                jitter = random.uniform(0.85, 1.15)  # ±15%
-
-            effective_delay *= jitter
-
-            # Wait if not enough time has passed
-            if time_since_last < effective_delay:
-                sleep_time = effective_delay - time_since_last
-                logger.debug(
-                    f"Rate limit wait: {sleep_time:.2f}s "
-                    f"(emergency={self.emergency_mode}, jitter={jitter:.2f}, "
-                    f"delay_mult={self.delay_multiplier:.1f})"
-                )
-                time.sleep(sleep_time)
+        now = time.monotonic()
+        sleep_time, jitter = self._reserve_delay(now)
+
+        # Wait if not enough time has passed
+        if sleep_time > 0:
+            logger.debug(
+                "Rate limit wait: %.2fs (emergency=%s, jitter=%.2f, delay_mult=%.1f)",
+                sleep_time,
+                self.emergency_mode,
+                jitter,
+                self.delay_multiplier,
+            )
+            time.sleep(sleep_time)
+            now = time.monotonic()
 
         # Enforce hourly request limit
-        self._enforce_hourly_limit()
+        if self._enforce_hourly_limit(now):
+            now = time.monotonic()
 
         # Record this request
-        self.last_request_time = time.time()
-        self.request_times.append(datetime.now())
+        self.last_request_time = now
+        self._append_request_time(now)
+
+    def _reserve_delay(self, current_time: float) -> Tuple[float, float]:
+        """
+        Compute how long to wait before the next request (no I/O, no sleeping).
+
+        Args:
+            current_time: Current time.monotonic() value
+
+        Returns:
+            (seconds to sleep, jitter multiplier applied); sleep is 0 if none
+        """
+        if self.last_request_time <= 0:
+            return 0.0, 1.0
+
+        # Phase 1.2: ALWAYS add jitter (not just emergency mode)
+        # Normal mode: ±15% jitter, Emergency mode: ±25% jitter
+        if self._jitter_idx == _JITTER_TABLE_SIZE:
+            self._refill_jitter()
+        jitter = self._jitter_table[self._jitter_idx]
+        self._jitter_idx += 1
+
+        # Phase 1.3: Effective delay with adaptive and emergency multipliers
+        effective_delay = (
+            self.base_delay * self.delay_multiplier * self._emergency_factor * jitter
+        )
+        return (
+            max(0.0, effective_delay - (current_time - self.last_request_time)),
+            jitter,
+        )
+
+    def _refill_jitter(self) -> None:
+        """Draw a fresh batch of jitter multipliers for both modes."""
+        self._jitter_normal = self._rng.uniform(0.85, 1.15, _JITTER_TABLE_SIZE).tolist()
+        self._jitter_emergency = self._rng.uniform(
+            0.75, 1.25, _JITTER_TABLE_SIZE
+        ).tolist()
+        self._jitter_idx = 0
+        self._jitter_table = (
+            self._jitter_emergency if self.emergency_mode else self._jitter_normal
+        )
 
-    def _enforce_hourly_limit(self) -> None:
+    @property
+    def emergency_mode(self) -> bool:
+        """Whether emergency mode is active (assigning it switches the mode)."""
+        return self._emergency_mode
+
+    @emergency_mode.setter
+    def emergency_mode(self, enabled: bool) -> None:
+        self._set_emergency_mode(enabled)
+
+    def _set_emergency_mode(self, enabled: bool) -> None:
+        """Switch emergency mode and the delay factor/jitter table it implies."""
+        self._emergency_mode = enabled
+        if enabled:
+            self._emergency_factor = float(self.emergency_multiplier)
+            self._jitter_table = self._jitter_emergency
+        else:
+            self._emergency_factor = 1.0
+            self._jitter_table = self._jitter_normal
+
+    def _enforce_hourly_limit(self, now: Optional[float] = None) -> bool:
         """
         Ensure we don't exceed hourly request quota.
 
         Uses sliding window: removes requests older than 1 hour,
         waits if we're at capacity.
+
+        Args:
+            now: Current time.monotonic() value (read if not given)
+
+        Returns:
+            True if it slept
         """
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
+        if now is None:
+            now = time.monotonic()
+        one_hour_ago = now - 3600.0
 
         # Remove requests older than 1 hour from window
-        while self.request_times and self.request_times[0] < one_hour_ago:
-            self.request_times.popleft()
+        self._evict_before(one_hour_ago)
 
         # If at capacity, wait until oldest request expires
-        if len(self.request_times) >= self.requests_per_hour:
-            oldest = self.request_times[0]
-            wait_until = oldest + timedelta(hours=1)
-            wait_seconds = (wait_until - now).total_seconds()
+        if self._count >= self.requests_per_hour:
+            wait_seconds = self._rt_buf[self._head] + 3600.0 - now
 
             if wait_seconds > 0:
                 logger.warning(
-                    f"Hourly limit reached ({self.requests_per_hour} req/hr). "
-                    f"Waiting {wait_seconds:.0f}s until quota resets"
+                    "Hourly limit reached (%d req/hr). Waiting %.0fs until quota resets",
+                    self.requests_per_hour,
+                    wait_seconds,
                 )
                 time.sleep(wait_seconds + 1)  # +1 for safety
+                return True
+
+        return False
+
+    @property
+    def request_times(self) -> np.ndarray:
+        """Timestamps of requests in the current window, oldest first."""
+        end = self._head + self._count
+        if end <= len(self._rt_buf):
+            return self._rt_buf[self._head : end].copy()
+        return np.concatenate(
+            (self._rt_buf[self._head :], self._rt_buf[: end - len(self._rt_buf)])
+        )
+
+    def _append_request_time(self, timestamp: float) -> None:
+        """Add a timestamp to the ring buffer, overwriting the oldest if full."""
+        capacity = len(self._rt_buf)
+        self._rt_buf[(self._head + self._count) % capacity] = timestamp
+        if self._count < capacity:
+            self._count += 1
+        else:
+            self._head = (self._head + 1) % capacity
+
+    def _evict_before(self, cutoff: float) -> None:
+        """Drop timestamps older than cutoff (buffer is sorted oldest first)."""
+        capacity = len(self._rt_buf)
+        end = self._head + self._count
+
+        if end <= capacity:
+            expired = int(np.searchsorted(self._rt_buf[self._head : end], cutoff))
+        else:
+            # Wrapped: older entries run from _head to the end, newer from 0
+            older = self._rt_buf[self._head :]
+            expired = int(np.searchsorted(older, cutoff))
+            if expired == len(older):
+                expired += int(np.searchsorted(self._rt_buf[: end - capacity], cutoff))
+
+        self._head = (self._head + expired) % capacity
+        self._count -= expired
 
     def record_success(self) -> None:
         """
@@ -168,14 +270,14 @@ class AdaptiveRateLimiter:
         """
         if self.consecutive_failures > 0:
             logger.info(
-                f"Success after {self.consecutive_failures} failures - "
-                f"resetting failure counter"
+                "Success after %d failures - resetting failure counter",
+                self.consecutive_failures,
             )
 
         self.consecutive_failures = 0
 
         if self.emergency_mode:
-            self.emergency_mode = False
+            self._set_emergency_mode(False)
             logger.info("Exiting emergency mode - back to normal operation")
 
         # Phase 1.3: Gradual recovery of delay multiplier
@@ -183,7 +285,9 @@ class AdaptiveRateLimiter:
             old_multiplier = self.delay_multiplier
             self.delay_multiplier = max(1.0, self.delay_multiplier * 0.8)
             logger.info(
-                f"Gradual delay recovery: {old_multiplier:.2f}x → {self.delay_multiplier:.2f}x"
+                "Gradual delay recovery: %.2fx → %.2fx",
+                old_multiplier,
+                self.delay_multiplier,
             )
 
     def record_failure(self) -> None:
@@ -199,29 +303,34 @@ class AdaptiveRateLimiter:
         if self.consecutive_failures == 1:
             self.delay_multiplier = 1.5  # +50%
             logger.warning(
-                f"First 429 detected - increasing delays by 50% "
-                f"(delay_multiplier={self.delay_multiplier})"
+                "First 429 detected - increasing delays by 50%% (delay_multiplier=%s)",
+                self.delay_multiplier,
             )
         elif self.consecutive_failures == 2:
             self.delay_multiplier = 2.0  # +100%
             logger.warning(
-                f"Second 429 detected - increasing delays by 100% "
-                f"(delay_multiplier={self.delay_multiplier})"
+                "Second 429 detected - increasing delays by 100%% (delay_multiplier=%s)",
+                self.delay_multiplier,
             )
         elif self.consecutive_failures >= 3 and not self.emergency_mode:
-            self.emergency_mode = True
+            self._set_emergency_mode(True)
             self.delay_multiplier = 3.0
-            new_delay = (
-                self.base_delay * self.delay_multiplier * self.emergency_multiplier
-            )
 
-            logger.critical(
-                f"EMERGENCY MODE ACTIVATED!\n"
-                f"   Consecutive 429s: {self.consecutive_failures}\n"
-                f"   Delay multiplier: {self.delay_multiplier}x\n"
-                f"   New effective delay: {new_delay:.0f}s (was {self.base_delay:.0f}s)\n"
-                f"   This indicates severe rate limiting - proceeding cautiously"
-            )
+            if logger.isEnabledFor(logging.CRITICAL):
+                new_delay = (
+                    self.base_delay * self.delay_multiplier * self.emergency_multiplier
+                )
+                logger.critical(
+                    "EMERGENCY MODE ACTIVATED!\n"
+                    "   Consecutive 429s: %d\n"
+                    "   Delay multiplier: %sx\n"
+                    "   New effective delay: %.0fs (was %.0fs)\n"
+                    "   This indicates severe rate limiting - proceeding cautiously",
+                    self.consecutive_failures,
+                    self.delay_multiplier,
+                    new_delay,
+                    self.base_delay,
+                )
 
     def should_circuit_break(self) -> bool:
         """
@@ -236,12 +345,13 @@ class AdaptiveRateLimiter:
         threshold = self.emergency_threshold * 2
         should_break = self.consecutive_failures >= threshold
 
-        if should_break:
+        if should_break and logger.isEnabledFor(logging.CRITICAL):
             logger.critical(
-                f"CIRCUIT BREAKER TRIGGERED!\n"
-                f"   {self.consecutive_failures} consecutive failures "
-                f"(threshold: {threshold})\n"
-                f"   Stopping requests to avoid IP blocking"
+                "CIRCUIT BREAKER TRIGGERED!\n"
+                "   %d consecutive failures (threshold: %d)\n"
+                "   Stopping requests to avoid IP blocking",
+                self.consecutive_failures,
+                threshold,
             )
 
         return should_break
@@ -259,9 +369,9 @@ class AdaptiveRateLimiter:
             effective_delay *= self.emergency_multiplier
 
         return {
-            "requests_last_hour": len(self.request_times),
+            "requests_last_hour": self._count,
             "requests_per_hour_limit": self.requests_per_hour,
-            "utilization_pct": (len(self.request_times) / self.requests_per_hour) * 100,
+            "utilization_pct": (self._count / self.requests_per_hour) * 100,
             "consecutive_failures": self.consecutive_failures,
             "emergency_mode": self.emergency_mode,
             "base_delay": self.base_delay,
@@ -277,9 +387,10 @@ class AdaptiveRateLimiter:
         Useful when switching IPs or after long pause.
         """
         self.consecutive_failures = 0
-        self.emergency_mode = False
+        self._set_emergency_mode(False)
         self.delay_multiplier = 1.0  # Phase 1.3: Reset adaptive multiplier
-        self.request_times.clear()
+        self._head = 0
+        self._count = 0
         logger.info("Rate limiter state reset")
 
 
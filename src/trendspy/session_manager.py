@@ -7,21 +7,129 @@ Based on trendspy (MIT License) by sdil87
 License: MIT
 """
 
+import asyncio
+import functools
+import gc
+import importlib.util
 import pickle
 import logging
+import os
 import random
+import re
 import requests
+import threading
 import time
+from requests.cookies import create_cookie
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 from .tls_session import TLSImpersonationSession
-from .browser_profiles import get_random_profile
 
 logger = logging.getLogger(__name__)
 
+# Session file format: a text header line, then one tab-separated record per
+# line ("H", name, value) for headers and ("C", name, value, domain, path,
+# expires, secure, httponly) for cookies, the flags written as "1" or "".
+# Backslash, tab, CR and LF inside fields are backslash-escaped.
+_TSV_MAGIC = b"# trendspy session v2\n"
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _escape(value) -> str:
+    """Escape a field so it cannot break the tab/line structure."""
+    return str(value).translate(_ESCAPES)
+
+
+def _unescape(field: str) -> str:
+    """Reverse _escape()."""
+    if "\\" not in field:
+        return field
+    return _ESCAPE_RE.sub(lambda m: _UNESCAPES.get(m.group(1), m.group(1)), field)
+
+
+def _encode_state(state: dict) -> bytes:
+    """Serialize session state as tab-separated text lines."""
+    lines = [
+        f"H\t{_escape(name)}\t{_escape(value)}"
+        for name, value in state["headers"].items()
+    ]
+    for name, value, domain, path, expires, secure, httponly in state["cookies"]:
+        expires = "" if expires is None else expires
+        fields = map(_escape, (name, value, domain, path, expires))
+        flags = ("1" if secure else "", "1" if httponly else "")
+        lines.append("\t".join(("C", *fields, *flags)))
+    return _TSV_MAGIC + "\n".join(lines).encode("utf-8")
+
+
+def _decode_tsv(text: str) -> dict:
+    """Parse the tab-separated session file body (malformed lines are skipped)."""
+    headers = {}
+    cookies = []
+    # split("\n"), not splitlines(): the latter also breaks on \x0b, \x85, ...
+    for line in text.split("\n"):
+        fields = [_unescape(field) for field in line.split("\t")]
+        if fields[0] == "H" and len(fields) == 3:
+            headers[fields[1]] = fields[2]
+        elif fields[0] == "C" and len(fields) == 8:
+            expires = int(fields[5]) if fields[5] else None
+            cookies.append(fields[1:5] + [expires, bool(fields[6]), bool(fields[7])])
+    return {"cookies": cookies, "headers": headers}
+
+
+def _decode_state(data: bytes, legacy_pickle: bool = False):
+    """
+    Parse a session file written by _encode_state() or a legacy pickle.
+
+    Args:
+        data: File contents
+        legacy_pickle: Whether to unpickle files in the old pickle format
+
+    Returns:
+        State dict, or a Session object from a legacy pickle file
+
+    Raises:
+        ValueError: If the file is a pickle and legacy_pickle is False
+    """
+    if data.startswith(_TSV_MAGIC):
+        return _decode_tsv(data[len(_TSV_MAGIC) :].decode("utf-8"))
+
+    if not legacy_pickle:
+        raise ValueError(
+            "unrecognized session file (pass legacy_pickle=True to migrate "
+            "a pickle file from an older version)"
+        )
+
+    # Rebuilding a Session graph allocates many small objects; pause the
+    # cyclic GC so it does not rescan them repeatedly during the load
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _clone_cookie(cookie):
+    """Copy a cookie between jars, keeping expires and the Secure/HttpOnly flags."""
+    return create_cookie(
+        cookie.name,
+        cookie.value,
+        domain=cookie.domain,
+        path=cookie.path,
+        expires=cookie.expires,
+        secure=cookie.secure,
+        rest={"HttpOnly": None} if cookie.has_nonstandard_attr("HttpOnly") else {},
+    )
+
+
 # User-Agent pool with current browsers (November 2025)
 # Phase 1.1: User-Agent Rotation for anti-detection
-USER_AGENTS = [
+USER_AGENTS = (
     # Chrome 131 (November 2025 - CURRENT)
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -35,7 +143,67 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.0 Safari/605.1.15",
     # Edge 131
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0",
-]
+)
+
+# Pre-drawn User-Agents for the legacy rotation (refilled in batches)
+_UA_POOL: list = []
+_UA_BATCH = 1024
+
+
+def _next_ua() -> str:
+    """Next randomly chosen User-Agent, drawing a batch when the pool is empty."""
+    if not _UA_POOL:
+        _UA_POOL.extend(random.choices(USER_AGENTS, k=_UA_BATCH))
+    return _UA_POOL.pop()
+
+
+# Base headers (same for all browsers), merged under UA-specific headers
+_BASE_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json, text/javascript, */*; q=0.01",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Referer": "https://trends.google.com/",
+        "Origin": "https://trends.google.com",
+        "DNT": "1",  # Do Not Track
+        "Connection": "keep-alive",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-origin",
+    }
+)
+
+# Client Hints sent with the legacy User-Agent rotation
+_LEGACY_CLIENT_HINTS = MappingProxyType(
+    {
+        "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="131", "Google Chrome";v="131"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"macOS"',
+    }
+)
+
+# Warmup bodies up to this size are read so the connection returns to the
+# keep-alive pool; larger ones are abandoned (closing drops the connection)
+_WARMUP_DRAIN_BYTES = 256 * 1024
+
+# Session warmup pages: (name, URL, delay range in seconds)
+_WARMUP_STEPS = (
+    ("Homepage", "https://trends.google.com/trends/", (0.5, 1.5)),
+    ("Explore page", "https://trends.google.com/trends/explore", (1.0, 2.5)),
+    (
+        "Trending searches",
+        "https://trends.google.com/trends/trendingsearches/daily?geo=US",
+        (0.8, 2.0),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _profile_picker():
+    """Import browser_profiles on first use (skipped when profiles are disabled)."""
+    from .browser_profiles import get_random_profile
+
+    return get_random_profile
 
 
 class SessionManager:
@@ -49,18 +217,33 @@ class SessionManager:
     - Session save/load from disk
 
     Args:
-        session_file: Path to session pickle file (default: .trendspy_session.pkl)
+        session_file: Path to session file (default: .trendspy_session.pkl)
         persist_cookies: Whether to save/load cookies (default: True)
         use_tls_impersonation: Use curl_cffi for TLS fingerprint impersonation (default: True)
         tls_browser: Browser to impersonate (chrome131, chrome130, firefox132, etc.)
+        legacy_pickle: Load session files pickled by older versions (default: False).
+            Unpickling can run arbitrary code, so only enable it to migrate trusted files.
 
     Example:
         >>> manager = SessionManager()
         >>> session = manager.get_session()
         >>> # ... use session for requests ...
         >>> manager.save_session()  # Persist for next run
+
+    Use get_session_manager() to share one manager per set of arguments.
     """
 
+    __slots__ = (
+        "session_file",
+        "persist_cookies",
+        "use_tls_impersonation",
+        "tls_browser",
+        "use_browser_profiles",
+        "session_warmup",
+        "legacy_pickle",
+        "session",
+    )
+
     def __init__(
         self,
         session_file: str = ".trendspy_session.pkl",
@@ -69,6 +252,7 @@ class SessionManager:
         tls_browser: str = "chrome131",
         use_browser_profiles: bool = True,
         session_warmup: bool = True,
+        legacy_pickle: bool = False,
     ):
         self.session_file = Path(session_file)
         self.persist_cookies = persist_cookies
@@ -76,16 +260,19 @@ class SessionManager:
         self.tls_browser = tls_browser
         self.use_browser_profiles = use_browser_profiles
         self.session_warmup = session_warmup
+        self.legacy_pickle = legacy_pickle
         self.session = self._load_or_create_session()
 
         logger.info(
-            f"SessionManager initialized "
-            f"(persist_cookies={persist_cookies}, "
-            f"use_tls_impersonation={use_tls_impersonation}, "
-            f"tls_browser={tls_browser}, "
-            f"use_browser_profiles={use_browser_profiles}, "
-            f"session_warmup={session_warmup}, "
-            f"file={session_file})"
+            "SessionManager initialized (persist_cookies=%s, "
+            "use_tls_impersonation=%s, tls_browser=%s, "
+            "use_browser_profiles=%s, session_warmup=%s, file=%s)",
+            persist_cookies,
+            use_tls_impersonation,
+            tls_browser,
+            use_browser_profiles,
+            session_warmup,
+            session_file,
         )
 
     def _load_or_create_session(self) -> requests.Session:
@@ -98,16 +285,25 @@ class SessionManager:
         if self.persist_cookies and self.session_file.exists():
             try:
                 with open(self.session_file, "rb") as f:
-                    session = pickle.load(f)
-                    logger.info(
-                        f"Loaded existing session from {self.session_file} "
-                        f"with {len(session.cookies)} cookies"
-                    )
-                    return session
+                    state = _decode_state(f.read(), self.legacy_pickle)
+
+                if isinstance(state, dict):
+                    session = self._restore_state(state)
+                else:
+                    # Legacy pickle file: the whole Session object was pickled
+                    session = state
+
+                logger.info(
+                    "Loaded existing session from %s with %d cookies",
+                    self.session_file,
+                    len(session.cookies),
+                )
+                return session
             except Exception as e:
                 logger.warning(
-                    f"Failed to load session from {self.session_file}: {e}. "
-                    f"Creating new session."
+                    "Failed to load session from %s: %s. Creating new session.",
+                    self.session_file,
+                    e,
                 )
 
         return self._create_session()
@@ -128,7 +324,7 @@ class SessionManager:
         if self.use_tls_impersonation:
             session = TLSImpersonationSession(browser=self.tls_browser)
             logger.info(
-                f"Created TLS impersonation session " f"(browser={self.tls_browser})"
+                "Created TLS impersonation session (browser=%s)", self.tls_browser
             )
         else:
             session = requests.Session()
@@ -137,61 +333,86 @@ class SessionManager:
         # Phase 3.1: Use coherent browser profiles if enabled
         if self.use_browser_profiles:
             # Get a random coherent profile (UA + all Client Hints)
-            profile_headers = get_random_profile()
-
-            # Base headers (same for all browsers)
-            base_headers = {
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Referer": "https://trends.google.com/",
-                "Origin": "https://trends.google.com",
-                "DNT": "1",  # Do Not Track
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-            }
+            # Read-only view is enough: it is merged into a new dict below
+            profile_headers = _profile_picker()(copy=False)
 
             # Merge profile headers (includes UA and Client Hints) with base
-            headers = {**base_headers, **profile_headers}
+            headers = {**_BASE_HEADERS, **profile_headers}
 
-            ua_preview = headers.get("User-Agent", "Unknown")[:60]
-            logger.info(f"Using coherent browser profile: {ua_preview}...")
+            if logger.isEnabledFor(logging.INFO):
+                ua_preview = headers.get("User-Agent", "Unknown")[:60]
+                logger.info("Using coherent browser profile: %s...", ua_preview)
 
         else:
             # Phase 1.1: Legacy - Randomly select User-Agent from pool
-            selected_ua = random.choice(USER_AGENTS)
+            selected_ua = _next_ua()
 
             # Browser-like headers (old method)
             headers = {
                 "User-Agent": selected_ua,
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Referer": "https://trends.google.com/",
-                "Origin": "https://trends.google.com",
-                "DNT": "1",  # Do Not Track
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-                "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="131", "Google Chrome";v="131"',
-                "Sec-Ch-Ua-Mobile": "?0",
-                "Sec-Ch-Ua-Platform": '"macOS"',
+                **_BASE_HEADERS,
+                **_LEGACY_CLIENT_HINTS,
             }
 
-            logger.info(f"Using legacy UA rotation: {selected_ua[:50]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Using legacy UA rotation: %s...", selected_ua[:50])
 
-        # Update headers (works for both TLSImpersonationSession and requests.Session)
-        if hasattr(session, "headers"):
-            if isinstance(session.headers, dict):
-                session.headers.update(headers)
-            else:
-                session.headers = headers
-        else:
-            session.headers = headers
+        # Both session types expose a mutable headers mapping: a plain dict on
+        # TLSImpersonationSession, a CaseInsensitiveDict on requests.Session
+        session.headers.update(headers)  # type: ignore[union-attr]
+
+        return session
+
+    def _dump_state(self) -> dict:
+        """
+        Build the persisted session state (cookies and headers only).
 
+        Returns:
+            Dict of plain values, independent of the session implementation
+        """
+        cookies = getattr(self.session.cookies, "jar", self.session.cookies)
+        return {
+            "cookies": [
+                [
+                    c.name,
+                    c.value,
+                    c.domain,
+                    c.path,
+                    c.expires,
+                    c.secure,
+                    c.has_nonstandard_attr("HttpOnly"),
+                ]
+                for c in cookies
+            ],
+            "headers": dict(self.session.headers),
+        }
+
+    def _restore_state(self, state: dict):
+        """
+        Create a new session and apply a state saved by _dump_state().
+
+        Args:
+            state: Persisted session state
+
+        Returns:
+            New session carrying the saved cookies and headers
+        """
+        session = self._create_session()
+        jar = getattr(session.cookies, "jar", session.cookies)
+        for name, value, domain, path, expires, secure, httponly in state["cookies"]:
+            jar.set_cookie(
+                create_cookie(
+                    name,
+                    value,
+                    domain=domain,
+                    path=path,
+                    expires=expires,
+                    secure=secure,
+                    rest={"HttpOnly": None} if httponly else {},
+                )
+            )
+        # Saved headers win so the User-Agent stays consistent with the cookies
+        session.headers.update(state["headers"])
         return session
 
     def save_session(self) -> bool:
@@ -204,18 +425,26 @@ class SessionManager:
         if not self.persist_cookies:
             return False
 
+        # Write a temp file and rename it over the old one, so a crash
+        # mid-write never leaves a truncated session file behind
+        tmp_file = self.session_file.with_suffix(self.session_file.suffix + ".tmp")
         try:
-            with open(self.session_file, "wb") as f:
-                pickle.dump(self.session, f)
-
-            logger.info(
-                f"Saved session to {self.session_file} "
-                f"({len(self.session.cookies)} cookies)"
-            )
+            with open(tmp_file, "wb") as f:
+                f.write(_encode_state(self._dump_state()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.session_file)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Saved session to %s (%d cookies)",
+                    self.session_file,
+                    len(self.session.cookies),
+                )
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save session: {e}")
+            logger.error("Failed to save session: %s", e)
             return False
 
     def get_session(self) -> requests.Session:
@@ -250,11 +479,11 @@ class SessionManager:
         try:
             if self.session_file.exists():
                 self.session_file.unlink()
-                logger.info(f"Deleted saved session file: {self.session_file}")
+                logger.info("Deleted saved session file: %s", self.session_file)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Failed to delete session file: {e}")
+            logger.error("Failed to delete session file: %s", e)
             return False
 
     def warmup_session(self) -> bool:
@@ -264,10 +493,10 @@ class SessionManager:
         Visits Google Trends pages in a natural sequence before making API calls.
         This mimics real user behavior - no human jumps straight to API endpoints.
 
-        Sequence:
-        1. Visit homepage (random delay 0.5-1.5s)
-        2. Visit explore page (random delay 1.0-2.5s)
-        3. Visit trending searches (random delay 0.8-2.0s)
+        Pages (fetched concurrently, each after its own random delay):
+        1. Homepage (0.5-1.5s)
+        2. Explore page (1.0-2.5s)
+        3. Trending searches (0.8-2.0s)
 
         Returns:
             True if warmup successful, False if errors occurred
@@ -279,39 +508,189 @@ class SessionManager:
         logger.info("Starting session warmup (human-like browsing)")
 
         try:
-            # Step 1: Visit homepage
-            delay = random.uniform(0.5, 1.5)
-            logger.debug(f"Warmup step 1/3: Homepage (delay {delay:.2f}s)")
-            time.sleep(delay)
+            # Each page waits its own random delay, so the visits overlap
+            # and total wait is the longest delay rather than the sum.
+            # Delays are fixed as monotonic deadlines from one start time, so
+            # thread start-up and logging do not add to them.
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=len(_WARMUP_STEPS)) as executor:
+                futures = []
+                for step, (name, url, delay_range) in enumerate(_WARMUP_STEPS, 1):
+                    delay = random.uniform(*delay_range)
+                    logger.debug(
+                        "Warmup step %d/%d: %s (delay %.2fs)",
+                        step,
+                        len(_WARMUP_STEPS),
+                        name,
+                        delay,
+                    )
+                    futures.append(executor.submit(self._timed_get, url, start + delay))
+
+                status_codes = [future.result().status_code for future in futures]
 
-            response1 = self.session.get("https://trends.google.com/trends/")
-            logger.debug(f"Homepage response: {response1.status_code}")
+            for (name, _, _), status_code in zip(_WARMUP_STEPS, status_codes):
+                logger.debug("%s response: %s", name, status_code)
 
-            # Step 2: Visit explore page
-            delay = random.uniform(1.0, 2.5)
-            logger.debug(f"Warmup step 2/3: Explore page (delay {delay:.2f}s)")
-            time.sleep(delay)
+            logger.info(
+                "Session warmup complete (responses: %s)",
+                ", ".join(map(str, status_codes)),
+            )
+            return True
 
-            response2 = self.session.get("https://trends.google.com/trends/explore")
-            logger.debug(f"Explore response: {response2.status_code}")
+        except Exception as e:
+            logger.warning("Session warmup failed (non-critical): %s", e)
+            # Don't fail - warmup is optional enhancement
+            return False
+
+    async def awarmup_session(self) -> bool:
+        """
+        Async variant of warmup_session() using httpx.AsyncClient.
 
-            # Step 3: Visit trending searches
-            delay = random.uniform(0.8, 2.0)
-            logger.debug(f"Warmup step 3/3: Trending searches (delay {delay:.2f}s)")
-            time.sleep(delay)
+        Visits the same pages concurrently on one keep-alive client (HTTP/2
+        when the h2 package is installed), then copies the cookies it
+        received back into the session. Falls back to the threaded
+        warmup_session() when httpx is not installed, the session is
+        proxied, or it impersonates a browser TLS fingerprint with
+        curl_cffi, so warmup traffic never bypasses a configured proxy or
+        pairs httpx's TLS handshake with the browser's User-Agent.
 
-            response3 = self.session.get(
-                "https://trends.google.com/trends/trendingsearches/daily?geo=US"
-            )
-            logger.debug(f"Trending response: {response3.status_code}")
+        Returns:
+            True if warmup successful, False if errors occurred
+        """
+        if not self.session_warmup:
+            logger.debug("Session warmup disabled, skipping")
+            return True
+
+        try:
+            import httpx  # type: ignore
+        except ImportError:
+            httpx = None
+
+        if (
+            httpx is None
+            or getattr(self.session, "proxies", None)
+            or getattr(self.session, "using_curl_cffi", False)
+        ):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.warmup_session)
+
+        logger.info("Starting async session warmup (human-like browsing)")
+
+        session_jar = getattr(self.session.cookies, "jar", self.session.cookies)
+        jar = httpx.Cookies()
+        for c in session_jar:
+            jar.jar.set_cookie(_clone_cookie(c))
+
+        async def visit(client, url: str, delay: float) -> int:
+            await asyncio.sleep(delay)
+            # Only the status and cookies are needed, so skip the page body
+            async with client.stream("GET", url) as response:
+                return response.status_code
+
+        try:
+            async with httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                cookies=jar,
+                http2=importlib.util.find_spec("h2") is not None,
+                follow_redirects=True,
+            ) as client:
+                status_codes = await asyncio.gather(
+                    *(
+                        visit(client, url, random.uniform(*delay_range))
+                        for _, url, delay_range in _WARMUP_STEPS
+                    )
+                )
+
+                for c in client.cookies.jar:
+                    session_jar.set_cookie(_clone_cookie(c))
 
             logger.info(
-                f"Session warmup complete "
-                f"(responses: {response1.status_code}, {response2.status_code}, {response3.status_code})"
+                "Async session warmup complete (responses: %s)",
+                ", ".join(map(str, status_codes)),
             )
             return True
 
         except Exception as e:
-            logger.warning(f"Session warmup failed (non-critical): {e}")
-            # Don't fail - warmup is optional enhancement
+            logger.warning("Async session warmup failed (non-critical): %s", e)
             return False
+
+    def _timed_get(self, url: str, deadline: float):
+        """
+        GET a warmup page at a deadline (runs on a warmup worker thread).
+
+        Args:
+            url: Page to visit
+            deadline: time.monotonic() value to wait for; no wait if passed
+
+        Returns:
+            Response object (closed; the body is read and discarded)
+        """
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        # Cookies come from the response headers; the body is only drained
+        # (up to _WARMUP_DRAIN_BYTES) so the connection can be reused
+        response = self.session.get(url, stream=True)
+        drained = 0
+        for chunk in response.iter_content(chunk_size=16384):
+            drained += len(chunk)
+            if drained > _WARMUP_DRAIN_BYTES:
+                break
+        response.close()
+        return response
+
+
+# Managers shared by get_session_manager(), keyed on normalized arguments.
+# Never evicted: a second manager on the same file would overwrite its saves.
+_SHARED_MANAGERS: dict = {}
+_SHARED_MANAGERS_LOCK = threading.Lock()
+
+
+def get_session_manager(
+    session_file: str = ".trendspy_session.pkl",
+    persist_cookies: bool = True,
+    use_tls_impersonation: bool = True,
+    tls_browser: str = "chrome131",
+    use_browser_profiles: bool = True,
+    session_warmup: bool = True,
+    legacy_pickle: bool = False,
+) -> SessionManager:
+    """
+    Get a process-wide SessionManager, shared by all callers with the same arguments.
+
+    Repeated calls skip the session file load and TLS session setup of
+    constructing a new SessionManager. The shared session (cookies, headers,
+    proxies) is seen by every caller, so construct SessionManager directly
+    when an isolated session is needed.
+
+    Arguments are normalized before the cache lookup, so defaults, keywords
+    and positional values (and str or Path session files) that name the
+    same settings share one manager.
+
+    Args are the same as SessionManager.
+
+    Example:
+        >>> manager = get_session_manager()
+        >>> get_session_manager(session_file=".trendspy_session.pkl") is manager
+        True
+    """
+    key = (
+        os.fspath(Path(session_file)),
+        bool(persist_cookies),
+        bool(use_tls_impersonation),
+        tls_browser,
+        bool(use_browser_profiles),
+        bool(session_warmup),
+        bool(legacy_pickle),
+    )
+    with _SHARED_MANAGERS_LOCK:
+        manager = _SHARED_MANAGERS.get(key)
+        if manager is None:
+            manager = _SHARED_MANAGERS[key] = SessionManager(*key)
+        return manager
+
+
+def reset_session_manager_cache():
+    """Drop the SessionManagers shared by get_session_manager (e.g. between tests)."""
+    with _SHARED_MANAGERS_LOCK:
+        _SHARED_MANAGERS.clear()
@@ -15,9 +15,11 @@ By using curl_cffi with browser impersonation, we match real Chrome/Firefox
 TLS fingerprints, which dramatically reduces blocking.
 """
 
+import functools
 import logging
 from typing import Any, Union
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from curl_cffi import requests as curl_requests
@@ -31,6 +33,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Connection pool size for the requests fallback (urllib3 default is 10)
+_POOL_SIZE = 32
+
 
 class TLSImpersonationSession:
     """
@@ -51,6 +56,16 @@ class TLSImpersonationSession:
     with a warning.
     """
 
+    __slots__ = (
+        "browser",
+        "session",
+        "_using_curl_cffi",
+        "_get",
+        "_post",
+        "headers",
+        "proxies",
+    )
+
     def __init__(self, browser: str = "chrome131"):
         """
         Initialize TLS impersonation session.
@@ -68,17 +83,57 @@ class TLSImpersonationSession:
             )
             self.session: Union[requests.Session, Any] = requests.Session()
             self._using_curl_cffi = False
+
+            # Larger keep-alive pool so request bursts reuse connections
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=0
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
         else:
             logger.info(f"Creating TLS impersonation session (browser={browser})")
             self.session = curl_requests.Session()  # type: ignore
             self._using_curl_cffi = True
 
+        self._bind_requests()
+
         # Store headers separately (compatible with both session types)
         self.headers: dict = {}
 
         # Initialize proxies attribute (compatible with requests.Session interface)
         self.proxies: dict = {}
 
+    def _bind_requests(self) -> None:
+        """Bind the request callables once (impersonate is fixed per session)."""
+        if self._using_curl_cffi:
+            self._get = functools.partial(self.session.get, impersonate=self.browser)
+            self._post = functools.partial(self.session.post, impersonate=self.browser)
+        else:
+            self._get = self.session.get
+            self._post = self.session.post
+
+    def __getstate__(self) -> dict:
+        """Picklable state; the bound request callables are rebuilt on load."""
+        return {
+            "browser": self.browser,
+            "session": self.session,
+            "_using_curl_cffi": self._using_curl_cffi,
+            "headers": self.headers,
+            "proxies": self.proxies,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a pickled session, including the __dict__ state pickled by
+        versions before __slots__ (legacy session files).
+        """
+        self.browser = state["browser"]
+        self.session = state["session"]
+        self._using_curl_cffi = state["_using_curl_cffi"]
+        self.headers = state.get("headers", {})
+        self.proxies = state.get("proxies", {})
+        self._bind_requests()
+
     def get(self, url: str, **kwargs) -> Any:
         """
         Perform GET request with TLS impersonation.
@@ -90,16 +145,8 @@ class TLSImpersonationSession:
         Returns:
             Response object
         """
-        # Merge instance headers with any passed headers
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
-        kwargs["headers"].update(self.headers)
-
-        if self._using_curl_cffi:
-            # type: ignore[call-arg]
-            return self.session.get(url, impersonate=self.browser, **kwargs)
-        else:
-            return self.session.get(url, **kwargs)
+        self._merge_headers(kwargs)
+        return self._get(url, **kwargs)
 
     def post(self, url: str, **kwargs) -> Any:
         """
@@ -112,16 +159,26 @@ class TLSImpersonationSession:
         Returns:
             Response object
         """
-        # Merge instance headers with any passed headers
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
-        kwargs["headers"].update(self.headers)
+        self._merge_headers(kwargs)
+        return self._post(url, **kwargs)
 
-        if self._using_curl_cffi:
-            # type: ignore[call-arg]
-            return self.session.post(url, impersonate=self.browser, **kwargs)
+    def _merge_headers(self, kwargs: dict) -> None:
+        """
+        Set kwargs["headers"] to the headers to send (instance headers win).
+
+        Without per-call headers the instance dict is passed as-is; neither
+        requests nor curl_cffi mutates it, so no per-request copy is needed.
+        """
+        headers = kwargs.get("headers")
+        if headers is None:
+            kwargs["headers"] = self.headers
         else:
-            return self.session.post(url, **kwargs)
+            kwargs["headers"] = {**headers, **self.headers}
+
+    @property
+    def using_curl_cffi(self) -> bool:
+        """Whether requests go out with curl_cffi's impersonated TLS fingerprint."""
+        return self._using_curl_cffi
 
     @property
     def cookies(self):
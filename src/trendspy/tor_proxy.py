@@ -10,10 +10,13 @@ Requires: tor installed (brew install tor on macOS)
 License: MIT
 """
 
+import itertools
 import logging
+import threading
 import time
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Optional, Sequence, Tuple
 
 try:
     from stem import Signal  # type: ignore
@@ -25,6 +28,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Seconds a looked-up exit IP is reused before probing again
+_IP_CACHE_TTL = 30.0
+
 
 class TorProxyRotator:
     """
@@ -39,6 +45,10 @@ class TorProxyRotator:
         tor_port: Tor SOCKS5 proxy port (default: 9050)
         control_port: Tor control port (default: 9051)
         password: Tor control password (optional)
+        tor_ports: Several SocksPorts of the same Tor instance (e.g. torrc
+            with SocksPort 9050, 9052, 9054). Tor keeps each port on its own
+            circuits, so get_proxy_config() cycles through them for parallel
+            exit IPs. Defaults to [tor_port].
 
     Example:
         >>> tor = TorProxyRotator()
@@ -52,11 +62,27 @@ class TorProxyRotator:
         >>> current_ip = tor.get_current_ip()
     """
 
+    __slots__ = (
+        "tor_port",
+        "control_port",
+        "password",
+        "tor_ports",
+        "_proxy_configs",
+        "_proxy_cycle",
+        "proxy_config",
+        "_controller",
+        "_lock",
+        "_probe_session",
+        "_ip_cache",
+        "_rotations",
+    )
+
     def __init__(
         self,
         tor_port: int = 9050,
         control_port: int = 9051,
         password: Optional[str] = None,
+        tor_ports: Optional[Sequence[int]] = None,
     ):
         if not STEM_AVAILABLE:
             raise ImportError(
@@ -67,16 +93,40 @@ class TorProxyRotator:
         self.control_port = control_port
         self.password = password
 
-        self.proxy_config = {
-            "http": f"socks5://127.0.0.1:{tor_port}",
-            "https": f"socks5://127.0.0.1:{tor_port}",
-        }
+        # Control-port connection, opened on first rotation and reused
+        self._controller = None
+        self._lock = threading.Lock()
+
+        # (time.monotonic() of lookup, exit IP); empty IP means no cached value
+        self._ip_cache: Tuple[float, str] = (0.0, "")
+        self._rotations = 0  # Lookups started before a rotation are not cached
+
+        self.tor_ports = tuple(tor_ports) if tor_ports else (tor_port,)
+        self._proxy_configs = tuple(
+            {
+                "http": f"socks5://127.0.0.1:{port}",
+                "https": f"socks5://127.0.0.1:{port}",
+            }
+            for port in self.tor_ports
+        )
+        self._proxy_cycle = itertools.cycle(self._proxy_configs)
+
+        # First port's config (used for exit-IP probes)
+        self.proxy_config = self._proxy_configs[0]
+
+        # Keep-alive session for exit-IP probes (reuses the SOCKS tunnel).
+        # trust_env off so HTTP(S)_PROXY cannot take priority over Tor.
+        self._probe_session = requests.Session()
+        self._probe_session.trust_env = False
+        self._probe_session.proxies.update(self.proxy_config)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        self._probe_session.mount("https://", adapter)
 
         # Test connection
         self._test_connection()
 
         logger.info(
-            f"TorProxyRotator initialized (port={tor_port}, "
+            f"TorProxyRotator initialized (ports={list(self.tor_ports)}, "
             f"control_port={control_port})"
         )
 
@@ -108,12 +158,8 @@ class TorProxyRotator:
             True if rotation successful, False otherwise
         """
         try:
-            with Controller.from_port(port=self.control_port) as controller:
-                # Authenticate
-                if self.password:
-                    controller.authenticate(password=self.password)
-                else:
-                    controller.authenticate()
+            with self._lock:
+                controller = self._get_controller()
 
                 # Request new circuit
                 controller.signal(Signal.NEWNYM)
@@ -124,30 +170,91 @@ class TorProxyRotator:
                     logger.debug(f"Waiting {wait_time}s for new Tor circuit")
                     time.sleep(wait_time)
 
-                # Verify new IP
-                new_ip = self.get_current_ip()
-                logger.info(f"Rotated to new Tor exit IP: {new_ip}")
+                # NEWNYM only affects new streams; drop the pooled probe
+                # connection so the IP check below opens one on the new circuit
+                self._probe_session.close()
 
-                return True
+                # The exit IP changed with the circuit; force a fresh lookup.
+                # Cleared only now, so a lookup racing the wait above cannot
+                # re-cache the old IP for the whole TTL.
+                self._rotations += 1
+                self._ip_cache = (0.0, "")
+
+            # Verify new IP
+            new_ip = self.get_current_ip()
+            logger.info(f"Rotated to new Tor exit IP: {new_ip}")
+
+            return True
 
         except Exception as e:
             logger.error(f"Failed to rotate Tor IP: {e}")
+            # Drop the connection so the next rotation reconnects
+            self._close_controller()
             return False
 
+    def _get_controller(self):
+        """
+        Get the authenticated control-port connection, connecting if needed.
+
+        Must be called with self._lock held.
+
+        Returns:
+            stem Controller
+        """
+        controller = self._controller
+        if controller is None or not controller.is_alive():
+            controller = Controller.from_port(port=self.control_port)
+            try:
+                if self.password:
+                    controller.authenticate(password=self.password)
+                else:
+                    controller.authenticate()
+            except Exception:
+                controller.close()
+                raise
+            self._controller = controller
+        return controller
+
+    def close(self) -> None:
+        """Close the Tor control-port connection and the IP probe session."""
+        self._close_controller()
+        self._probe_session.close()
+
+    def _close_controller(self) -> None:
+        """Close the Tor control-port connection, if open."""
+        with self._lock:
+            controller, self._controller = self._controller, None
+        if controller is not None:
+            try:
+                controller.close()
+            except Exception as e:
+                logger.debug(f"Error closing Tor controller: {e}")
+
     def get_current_ip(self) -> Optional[str]:
         """
         Get current Tor exit node IP address.
 
+        Successful lookups are reused for _IP_CACHE_TTL seconds (until the
+        next rotate_ip()).
+
         Returns:
             IP address string or None if failed
         """
+        now = time.monotonic()
+        cached_at, cached_ip = self._ip_cache
+        if cached_ip and now - cached_at < _IP_CACHE_TTL:
+            return cached_ip
+
+        rotations = self._rotations
         try:
-            response = requests.get(
-                "https://api.ipify.org?format=text",
-                proxies=self.proxy_config,
-                timeout=10,
+            response = self._probe_session.get(
+                "https://api.ipify.org?format=text", timeout=10
             )
-            return response.text.strip()
+            ip = response.text.strip()
+            with self._lock:
+                if rotations == self._rotations:
+                    self._ip_cache = (now, ip)
+            return ip
         except Exception as e:
             logger.warning(f"Failed to get current IP: {e}")
             return None
@@ -156,10 +263,12 @@ class TorProxyRotator:
         """
         Get proxy configuration for requests library.
 
+        With several tor_ports, successive calls round-robin over them.
+
         Returns:
             Dictionary with http/https proxy settings
         """
-        return self.proxy_config
+        return next(self._proxy_cycle)
 
     def test_tor_connection(self) -> bool:
         """
@@ -177,7 +286,10 @@ class TorProxyRotator:
 
 # Convenience function
 def create_tor_proxy(
-    tor_port: int = 9050, control_port: int = 9051, password: Optional[str] = None
+    tor_port: int = 9050,
+    control_port: int = 9051,
+    password: Optional[str] = None,
+    tor_ports: Optional[Sequence[int]] = None,
 ) -> Optional[TorProxyRotator]:
     """
     Create TorProxyRotator if Tor is available.
@@ -186,7 +298,7 @@ def create_tor_proxy(
         TorProxyRotator instance or None if Tor not available
     """
     try:
-        return TorProxyRotator(tor_port, control_port, password)
+        return TorProxyRotator(tor_port, control_port, password, tor_ports)
     except Exception as e:
         logger.warning(f"Tor not available: {e}")
         return None
@@ -14,7 +14,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from trendspy import Trends
 from trendspy.rate_limiter import AdaptiveRateLimiter, CircuitBreakerError
-from trendspy.session_manager import SessionManager
+from trendspy.quota_analyzer import QuotaAnalyzer
+from trendspy.config_tuner import ConfigTuner
+from trendspy.degradation_manager import DegradationManager, HealthState, Priority
+from trendspy.metrics import MetricsCollector
+from trendspy.session_manager import (
+    SessionManager,
+    get_session_manager,
+    reset_session_manager_cache,
+)
 
 
 class TestRateLimiter:
@@ -71,6 +79,288 @@ class TestRateLimiter:
         assert not limiter.emergency_mode
 
 
+    def test_request_window_wraps_around_buffer(self):
+        """Verify the hourly window ring buffer across wrap-around."""
+        limiter = AdaptiveRateLimiter(requests_per_hour=4)
+        for t in (0.0, 1.0, 2.0, 3.0):
+            limiter._append_request_time(t)
+
+        limiter._evict_before(1.5)
+        assert list(limiter.request_times) == [2.0, 3.0]
+
+        # Newer entries wrap to the start of the buffer
+        limiter._append_request_time(4.0)
+        limiter._append_request_time(5.0)
+        assert list(limiter.request_times) == [2.0, 3.0, 4.0, 5.0]
+
+        # Full buffer: the oldest entry is overwritten
+        limiter._append_request_time(6.0)
+        assert list(limiter.request_times) == [3.0, 4.0, 5.0, 6.0]
+
+    def test_request_window_evicts_across_buffer_end(self):
+        """Verify eviction that spans the end of the ring buffer."""
+        limiter = AdaptiveRateLimiter(requests_per_hour=4)
+        for t in (0.0, 1.0, 2.0, 3.0):
+            limiter._append_request_time(t)
+        limiter._evict_before(1.5)
+        for t in (4.0, 5.0):  # Stored at indexes 0-1, oldest at index 2
+            limiter._append_request_time(t)
+
+        limiter._evict_before(2.5)  # Part of the older run only
+        assert list(limiter.request_times) == [3.0, 4.0, 5.0]
+
+        limiter._evict_before(4.5)  # Rest of the older run plus a newer entry
+        assert list(limiter.request_times) == [5.0]
+
+        limiter._evict_before(100.0)
+        assert list(limiter.request_times) == []
+        assert limiter.get_stats()['requests_last_hour'] == 0
+
+    def test_hourly_limit_waits_for_oldest_request(self, monkeypatch):
+        """Verify a full window waits until its oldest request expires."""
+        limiter = AdaptiveRateLimiter(requests_per_hour=2)
+        limiter._append_request_time(1000.0)
+        limiter._append_request_time(1010.0)
+
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+        assert limiter._enforce_hourly_limit(now=1100.0)
+        assert sleeps == [pytest.approx(3600.0 - 100.0 + 1)]
+
+        # After the oldest request ages out there is room again
+        assert not limiter._enforce_hourly_limit(now=4601.0)
+        assert list(limiter.request_times) == [1010.0]
+
+    def test_assigning_emergency_mode_scales_delay(self):
+        """Verify setting emergency_mode directly applies the multiplier."""
+        limiter = AdaptiveRateLimiter(base_delay=10, emergency_multiplier=3)
+        limiter.last_request_time = 100.0
+
+        limiter.emergency_mode = True
+        sleep_time, jitter = limiter._reserve_delay(100.0)
+        assert limiter.get_stats()['emergency_mode']
+        assert sleep_time == pytest.approx(30 * jitter)
+
+        limiter.emergency_mode = False
+        sleep_time, jitter = limiter._reserve_delay(100.0)
+        assert sleep_time == pytest.approx(10 * jitter)
+
+
+class TestQuotaAnalyzer:
+    """Test quota window detection."""
+
+    def test_detects_window_from_supplied_timestamps(self):
+        """Verify caller-supplied timestamps keep their precision."""
+        for start in (0.0, 1577836800.0):  # Far from "now" either way
+            analyzer = QuotaAnalyzer()
+            for i in range(30):
+                analyzer.record_result(success=True, timestamp=start + i * 60.4)
+
+            assert analyzer.detect_quota_window() == pytest.approx(60.4, abs=0.01)
+            assert analyzer.success_timestamps[0] == start
+
+
+class TestConfigTuner:
+    """Test configuration tuning history."""
+
+    def test_history_with_numpy_values_round_trips(self, tmp_path):
+        """Verify NumPy metric values are saved and reloaded."""
+        import numpy as np
+
+        history_file = tmp_path / 'history.json'
+        tuner = ConfigTuner(history_file=str(history_file), flush_every=1)
+        tuner.record_session(
+            config={'base_delay': np.int64(12)},
+            success_rate=np.float64(91.5),
+            avg_response_time=np.float32(2.5),
+        )
+
+        reloaded = ConfigTuner(history_file=str(history_file))
+        assert len(reloaded.performance_history) == 1
+        record = reloaded.performance_history[0]
+        assert record['base_delay'] == 12
+        assert record['success_rate'] == 91.5
+        assert record['response_time'] == 2.5
+
+
+    def test_suggestion_ties_go_to_earliest_session(self, tmp_path):
+        """Verify exact ties suggest the first matching session, as max() did."""
+        tuner = ConfigTuner(history_file=str(tmp_path / 'history.json'))
+        tuner.record_session(config={'base_delay': 30}, success_rate=50, avg_response_time=2)
+        for delay in (10, 20):
+            tuner.record_session(
+                config={'base_delay': delay}, success_rate=95, avg_response_time=2
+            )
+
+        assert tuner.suggest_optimal_config()['base_delay'] == 10
+
+    def test_performance_history_is_read_only(self, tmp_path):
+        """Verify the exposed history cannot desync the tuner's arrays."""
+        tuner = ConfigTuner(history_file=str(tmp_path / 'history.json'))
+        tuner.record_session(config={}, success_rate=90, avg_response_time=1)
+
+        history = tuner.performance_history
+        assert isinstance(history, tuple)
+        history[0]['success_rate'] = 0
+        assert tuner.performance_history[0]['success_rate'] == 90
+        assert tuner.get_stats()['total_sessions'] == 1
+
+    def test_flush_every_buffers_writes(self, tmp_path):
+        """Verify history is written every flush_every records and on flush()."""
+        history_file = tmp_path / 'history.json'
+        tuner = ConfigTuner(history_file=str(history_file), flush_every=3)
+
+        for rate in (90, 91):
+            tuner.record_session(config={}, success_rate=rate, avg_response_time=1)
+        assert not history_file.exists()
+
+        tuner.record_session(config={}, success_rate=92, avg_response_time=1)
+        assert len(ConfigTuner(history_file=str(history_file)).performance_history) == 3
+
+        tuner.record_session(config={}, success_rate=93, avg_response_time=1)
+        tuner.flush()
+        assert len(ConfigTuner(history_file=str(history_file)).performance_history) == 4
+
+    def test_pending_records_flushed_at_exit(self, tmp_path):
+        """Verify the atexit hook writes records still buffered in live tuners."""
+        from trendspy import config_tuner
+
+        history_file = tmp_path / 'history.json'
+        tuner = ConfigTuner(history_file=str(history_file), flush_every=10)
+        tuner.record_session(config={}, success_rate=90, avg_response_time=1)
+        assert not history_file.exists()
+
+        config_tuner._flush_live_tuners()
+        assert len(ConfigTuner(history_file=str(history_file)).performance_history) == 1
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        """Verify a failed save leaves the old history and no temp file."""
+        history_file = tmp_path / 'history.json'
+        tuner = ConfigTuner(history_file=str(history_file), flush_every=1)
+        tuner.record_session(config={}, success_rate=90, avg_response_time=1)
+        saved = history_file.read_bytes()
+
+        # Not JSON serializable
+        tuner.record_session(config={'bad': object()}, success_rate=91, avg_response_time=1)
+
+        assert history_file.read_bytes() == saved
+        assert list(tmp_path.iterdir()) == [history_file]
+
+
+
+class TestDegradationManager:
+    """Test health-state transitions."""
+
+    def test_degrades_and_recovers(self):
+        """Verify 429 streaks degrade health and successes restore it."""
+        manager = DegradationManager(
+            minor_threshold=2, major_threshold=4, recovery_successes=2
+        )
+
+        manager.update_health(got_429=True)
+        assert manager.health_state is HealthState.HEALTHY
+        manager.update_health(got_429=True)
+        assert manager.health_state is HealthState.DEGRADED_MINOR
+        assert not manager.should_process_keyword(Priority.LOW)
+        assert manager.should_process_keyword(Priority.MEDIUM)
+
+        for _ in range(2):
+            manager.update_health(got_429=True)
+        assert manager.health_state is HealthState.DEGRADED_MAJOR
+        assert not manager.should_process_keyword(Priority.MEDIUM)
+        assert manager.should_process_keyword(Priority.HIGH)
+
+        for _ in range(2):
+            manager.update_health(got_429=False)
+        assert manager.health_state is HealthState.RECOVERY
+        assert manager.should_process_keyword(Priority.LOW)
+
+        for _ in range(2):
+            manager.update_health(got_429=False)
+        assert manager.health_state is HealthState.HEALTHY
+        assert manager.consecutive_429s == 0
+
+    def test_threshold_changes_take_effect(self):
+        """Verify thresholds assigned after construction are used."""
+        manager = DegradationManager()
+        manager.minor_threshold = 1
+        manager.recovery_successes = 1
+
+        manager.update_health(got_429=True)
+        assert manager.health_state is HealthState.DEGRADED_MINOR
+
+        manager.update_health(got_429=False)
+        assert manager.health_state is HealthState.RECOVERY
+        manager.update_health(got_429=False)
+        assert manager.health_state is HealthState.HEALTHY
+
+
+
+def _record_shared_requests(shared_name, lock, count):
+    """Worker for TestMetrics: record requests into a shared segment."""
+    metrics = MetricsCollector(shared_name=shared_name, lock=lock)
+    for _ in range(count):
+        metrics.record_request(success=True, response_time=0.1, status_code=200)
+    metrics.close()
+
+
+class TestMetrics:
+    """Test metrics collection."""
+
+    def test_shared_counters_aggregate_across_processes(self):
+        """Verify workers sharing a segment and lock lose no updates."""
+        import multiprocessing
+        import uuid
+
+        shared_name = f'trendspy_test_{uuid.uuid4().hex[:12]}'
+        lock = multiprocessing.Lock()
+        owner = MetricsCollector(shared_name=shared_name, lock=lock)
+        try:
+            workers = [
+                multiprocessing.Process(
+                    target=_record_shared_requests, args=(shared_name, lock, 2000)
+                )
+                for _ in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+            assert all(worker.exitcode == 0 for worker in workers)
+            assert owner.requests_total == 8000
+            assert owner.requests_success == 8000
+        finally:
+            owner.close()
+
+        # Counters stay readable after detaching
+        assert owner.requests_total == 8000
+
+    def test_status_classes_ignore_missing_and_invalid_codes(self):
+        """Verify None or out-of-range status codes are recorded, unclassed."""
+        metrics = MetricsCollector()
+        for status_code in (200, 204, 404, 429, 503, None, 0, -1, 700):
+            metrics.record_request(
+                success=status_code in (200, 204),
+                response_time=0.5,
+                status_code=status_code,
+            )
+
+        summary = metrics.get_summary()
+        assert summary['total_requests'] == 9
+        assert summary['successful_requests'] == 2
+        assert summary['error_429_count'] == 1
+        assert summary['status_2xx'] == 2
+        assert summary['status_4xx'] == 2
+        assert summary['status_5xx'] == 1
+        assert summary['status_other'] == 4
+
+    def test_shared_counters_require_lock(self):
+        """Verify shared_name without a common lock is rejected."""
+        with pytest.raises(ValueError):
+            MetricsCollector(shared_name='trendspy_test_no_lock')
+
+
 class TestSessionManager:
     """Test session management."""
 
@@ -106,6 +396,179 @@ class TestSessionManager:
         # Cleanup
         manager2.clear_saved_session()
 
+    def test_session_file_round_trip(self, tmp_path):
+        """Verify headers and cookie attributes survive save and load."""
+        session_file = tmp_path / 'session.txt'
+        manager1 = SessionManager(session_file=str(session_file))
+        session1 = manager1.get_session()
+        session1.headers['X-Test'] = 'kept'
+        session1.cookies.set(
+            'NID', 'abc', domain='.google.com', path='/',
+            expires=2000000000, secure=True, rest={'HttpOnly': None},
+        )
+        session1.cookies.set('__Secure-ENID', 'def', domain='.google.com', secure=True)
+        session1.cookies.set('plain', 'ghi', domain='trends.google.com', rest={})
+        assert manager1.save_session()
+
+        session2 = SessionManager(session_file=str(session_file)).get_session()
+        cookies = {c.name: c for c in session2.cookies}
+
+        assert session2.headers['X-Test'] == 'kept'
+        assert cookies['NID'].value == 'abc'
+        assert cookies['NID'].expires == 2000000000
+        assert cookies['NID'].secure
+        assert cookies['NID'].has_nonstandard_attr('HttpOnly')
+        assert cookies['__Secure-ENID'].secure
+        assert not cookies['plain'].secure
+        assert not cookies['plain'].has_nonstandard_attr('HttpOnly')
+        assert cookies['plain'].domain == 'trends.google.com'
+
+    def test_session_file_escapes_tabs_and_newlines(self, tmp_path):
+        """Verify values containing tabs, newlines or backslashes round-trip."""
+        session_file = tmp_path / 'session.txt'
+        manager1 = SessionManager(session_file=str(session_file))
+        session1 = manager1.get_session()
+        session1.headers['X-Odd'] = 'a\tb\nc\\t\r'
+        session1.cookies.set('odd', 'x\ty\nz\\', domain='.google.com')
+        assert manager1.save_session()
+
+        session2 = SessionManager(session_file=str(session_file)).get_session()
+        assert session2.headers['X-Odd'] == 'a\tb\nc\\t\r'
+        assert session2.cookies['odd'] == 'x\ty\nz\\'
+
+    def test_legacy_pickle_rejected(self, tmp_path):
+        """Verify pickle session files are not loaded unless opted in."""
+        import pickle
+        import requests
+
+        legacy = requests.Session()
+        legacy.cookies.set('legacy_cookie', 'value')
+        session_file = tmp_path / 'legacy.pkl'
+        session_file.write_bytes(pickle.dumps(legacy))
+
+        session = SessionManager(session_file=str(session_file)).get_session()
+        assert 'legacy_cookie' not in session.cookies
+
+        migrated = SessionManager(
+            session_file=str(session_file), legacy_pickle=True
+        ).get_session()
+        assert migrated.cookies['legacy_cookie'] == 'value'
+
+    def test_legacy_tls_session_pickle_migrates(self, tmp_path):
+        """Verify TLSImpersonationSession pickles from before __slots__ load."""
+        import pickle
+        import requests
+        from trendspy.tls_session import TLSImpersonationSession
+
+        inner = requests.Session()
+        inner.cookies.set('NID', 'abc', domain='.google.com')
+
+        class LegacyPickle:
+            """Pickles like the old __dict__-based TLSImpersonationSession."""
+
+            def __reduce_ex__(self, protocol):
+                state = {
+                    'browser': 'chrome131',
+                    'session': inner,
+                    '_using_curl_cffi': False,
+                    'headers': {'User-Agent': 'Legacy UA'},
+                    'proxies': {},
+                }
+                return object.__new__, (TLSImpersonationSession,), state
+
+        session_file = tmp_path / 'legacy.pkl'
+        session_file.write_bytes(pickle.dumps(LegacyPickle()))
+
+        session = SessionManager(
+            session_file=str(session_file), legacy_pickle=True
+        ).get_session()
+        assert isinstance(session, TLSImpersonationSession)
+        assert session.cookies['NID'] == 'abc'
+        assert session.headers['User-Agent'] == 'Legacy UA'
+        assert pickle.loads(pickle.dumps(session)).headers == session.headers
+
+    def test_shared_session_manager_is_never_evicted(self, tmp_path):
+        """Verify many cached managers never duplicate one for the same file."""
+        first_file = str(tmp_path / 'session_0.txt')
+        first = get_session_manager(session_file=first_file, session_warmup=False)
+        for i in range(1, 20):
+            get_session_manager(
+                session_file=str(tmp_path / f'session_{i}.txt'), session_warmup=False
+            )
+
+        assert get_session_manager(
+            session_file=first_file, session_warmup=False
+        ) is first
+        reset_session_manager_cache()
+
+    def test_shared_session_manager(self):
+        """Verify the cached factory shares one manager until reset."""
+        manager = get_session_manager(
+            session_file='test_session_shared.pkl', session_warmup=False
+        )
+        assert get_session_manager(
+            session_file='test_session_shared.pkl', session_warmup=False
+        ) is manager
+        # Same settings passed positionally or left at their defaults
+        assert get_session_manager(
+            './test_session_shared.pkl', True, True, 'chrome131', True, False
+        ) is manager
+        assert get_session_manager() is get_session_manager(
+            session_file='.trendspy_session.pkl'
+        )
+
+        reset_session_manager_cache()
+        assert get_session_manager(
+            session_file='test_session_shared.pkl', session_warmup=False
+        ) is not manager
+
+        # Cleanup
+        manager.clear_saved_session()
+        reset_session_manager_cache()
+
+
+
+class TestTorProxy:
+    """Test Tor proxy configuration (no Tor process needed)."""
+
+    def test_proxy_config_round_robins_ports(self, monkeypatch):
+        """Verify get_proxy_config cycles through tor_ports in order."""
+        from trendspy import tor_proxy
+
+        monkeypatch.setattr(tor_proxy, 'STEM_AVAILABLE', True)
+        monkeypatch.setattr(
+            tor_proxy.TorProxyRotator, '_test_connection', lambda self: None
+        )
+        rotator = tor_proxy.TorProxyRotator(tor_ports=[9050, 9052, 9054])
+        try:
+            proxies = [rotator.get_proxy_config()['https'] for _ in range(4)]
+            assert proxies == [
+                'socks5://127.0.0.1:9050',
+                'socks5://127.0.0.1:9052',
+                'socks5://127.0.0.1:9054',
+                'socks5://127.0.0.1:9050',
+            ]
+            # IP probes always use the first port
+            assert rotator.proxy_config['http'] == 'socks5://127.0.0.1:9050'
+        finally:
+            rotator.close()
+
+    def test_single_port_by_default(self, monkeypatch):
+        """Verify tor_port alone gives the same config every call."""
+        from trendspy import tor_proxy
+
+        monkeypatch.setattr(tor_proxy, 'STEM_AVAILABLE', True)
+        monkeypatch.setattr(
+            tor_proxy.TorProxyRotator, '_test_connection', lambda self: None
+        )
+        rotator = tor_proxy.TorProxyRotator(tor_port=9150)
+        try:
+            assert rotator.tor_ports == (9150,)
+            assert rotator.get_proxy_config() == rotator.get_proxy_config()
+            assert rotator.get_proxy_config()['https'] == 'socks5://127.0.0.1:9150'
+        finally:
+            rotator.close()
+
 
 class TestIntegration:
     """Test full integration with real API."""